@@ -1,34 +1,299 @@
 import requests
 import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
+from typing import List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import AI_ENDPOINT
 
+try:
+    import orjson  # type: ignore
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # fallback if orjson missing
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
 logger = getLogger("voyager_ai")
 
 AI_PROVIDER = os.getenv("AI_PROVIDER", "hackclub")  # "hackclub" or "ollama"
 OLLAMA_ENDPOINT = os.getenv("OLLAMA_ENDPOINT", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "gemma2:2b")
+# ask about several answers in a single prompt instead of one request each
+AI_BATCH_VERIFY = os.getenv("AI_BATCH_VERIFY", "false").lower() == "true"
+AI_BATCH_SIZE = 16
+# remember verdicts for repeated (given, correct) pairs - opt-in, so verdicts
+# come straight from the model unless asked otherwise
+AI_VERIFY_CACHE = os.getenv("VOYAGER_VERIFY_CACHE", "0") == "1"
+AI_VERIFY_CACHE_SIZE = 4096
+# retry on the other provider when the configured one times out or is down
+AI_FAILOVER = os.getenv("AI_FAILOVER", "true").lower() == "true"
+
+# (connect, read) timeouts - read timeouts grow to 1.5x the observed p99
+_PROVIDER_TIMEOUT = {"hackclub": (3, 8), "ollama": (3, 10)}
+_MAX_READ_TIMEOUT = 30
+_LATENCY_WINDOW = 200
+_LATENCIES = {provider: deque(maxlen=_LATENCY_WINDOW) for provider in _PROVIDER_TIMEOUT}
+_read_timeouts = {
+    provider: timeout[1] for provider, timeout in _PROVIDER_TIMEOUT.items()
+}
+_latency_counts = {provider: 0 for provider in _PROVIDER_TIMEOUT}
+_LATENCY_LOCK = threading.Lock()
+
+# one pooled session for every verification - requests.post opens a fresh
+# connection (and TLS handshake) per call otherwise
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=2,
+        # only 5xx is retried - a timeout goes straight to failover rather than
+        # costing another full timeout on the same provider
+        connect=0,
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"POST"}),  # verification is idempotent
+    ),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# verifications are I/O bound, so a round's answers are checked side by side
+# instead of paying one round-trip per player
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="voyager_ai")
+
+_NON_WORD = re.compile(r"[\W_]+")
+_YESNO = re.compile(r"\b(yes|no)\b", re.IGNORECASE)
+
+_VERIFY_CACHE: "OrderedDict[Tuple[str, str], bool]" = OrderedDict()
+_VERIFY_CACHE_LOCK = threading.Lock()
+_cache_hits = 0
+_cache_misses = 0
+
+
+def _norm(text: str) -> str:
+    return _NON_WORD.sub("", text.casefold())
+
+
+def _verify_trivial(given_answer: str, correct_answer: str) -> Optional[bool]:
+    """Settle the answer without the AI when possible, otherwise None"""
+    given, correct = _norm(given_answer), _norm(correct_answer)
+    if given and given == correct:
+        return True
+    if not given or not correct:
+        # nothing left to compare fuzzily (punctuation-only or empty)
+        return given_answer.strip() == correct_answer.strip()
+    return None
+
+
+def matches_exactly(given_answer: str, correct_answers: List[str]) -> bool:
+    """Whether the answer exactly matches any accepted answer - never calls the AI"""
+    return any(_verify_trivial(given_answer, correct) for correct in correct_answers)
 
 
 def verify(given_answer: str, correct_answer: str) -> bool:
-    # return str([char.lower() for char in given_answer if char.isalpha()]) == str(
-    #     [char.lower() for char in correct_answer if char.isalpha()]
-    # )
+    # exact matches (ignoring case, spacing and punctuation) skip the round-trip
+    trivial = _verify_trivial(given_answer, correct_answer)
+    if trivial is not None:
+        return trivial
 
     return verify_ai(given_answer, correct_answer)
 
 
-def verify_ai(given_answer: str, correct_answer: str) -> bool:
+def verify_many(pairs: List[Tuple[str, str]]) -> List[bool]:
+    """Verify (given, correct) pairs concurrently, preserving order"""
+    if len(pairs) <= 1:
+        return [verify(given, correct) for given, correct in pairs]
+    if AI_BATCH_VERIFY:
+        chunks = [
+            pairs[i : i + AI_BATCH_SIZE] for i in range(0, len(pairs), AI_BATCH_SIZE)
+        ]
+        return [
+            result
+            for chunk_results in _EXECUTOR.map(verify_batch, chunks)
+            for result in chunk_results
+        ]
+    return list(_EXECUTOR.map(lambda pair: verify(*pair), pairs))
+
+
+def verify_batch(pairs: List[Tuple[str, str]]) -> List[bool]:
+    """Verify several pairs with a single prompt, one yes/no per line"""
+    results = [_verify_trivial(given, correct) for given, correct in pairs]
+    pending = [i for i, result in enumerate(results) if result is None]
+    if len(pending) <= 1:
+        return [
+            verify(*pairs[i]) if result is None else result
+            for i, result in enumerate(results)
+        ]
+
+    for i, is_correct in zip(pending, _verify_batch_ai([pairs[i] for i in pending])):
+        results[i] = is_correct
+    return results
+
+
+def _verify_batch_ai(pairs: List[Tuple[str, str]]) -> List[bool]:
+    questions = "\n".join(
+        f"{i}. Is ```{given}``` correct, if the correct answer is ```{correct}```?"
+        for i, (given, correct) in enumerate(pairs, start=1)
+    )
+    prompt = (
+        f"Answer each of the following {len(pairs)} questions with only `yes` or `no`, "
+        f"one answer per line, in order.\n\n{questions}"
+    )
+
+    try:
+        lines = [line.strip() for line in _complete(prompt).splitlines()]
+        answers = [line for line in lines if line]
+        if len(answers) != len(pairs):
+            raise ValueError(f"expected {len(pairs)} answers, got {len(answers)}")
+        return [_is_yes(answer) for answer in answers]
+    except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+        # the model didn't play along - ask about each pair on its own
+        logger.warning(f"Batch verification failed, falling back: {e}")
+        return [verify_ai(given, correct) for given, correct in pairs]
+
+
+def _record_latency(provider: str, seconds: float):
+    with _LATENCY_LOCK:
+        samples = _LATENCIES[provider]
+        samples.append(seconds)
+        _latency_counts[provider] += 1
+        # recompute every 20 samples rather than on every call
+        if _latency_counts[provider] % 20:
+            return
+        ordered = sorted(samples)
+        p50 = ordered[len(ordered) // 2]
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        base = _PROVIDER_TIMEOUT[provider][1]
+        read_timeout = min(max(base, p99 * 1.5), _MAX_READ_TIMEOUT)
+        _read_timeouts[provider] = read_timeout
+
+    logger.debug(
+        f"{provider} latency p50={p50:.2f}s p99={p99:.2f}s, "
+        f"read timeout {read_timeout:.1f}s"
+    )
+
+
+def _post_json(endpoint: str, payload: dict, provider: str) -> dict:
+    timeout = (_PROVIDER_TIMEOUT[provider][0], _read_timeouts[provider])
+    started = time.monotonic()
+    response = _SESSION.post(
+        endpoint, data=_dumps(payload), headers=_JSON_HEADERS, timeout=timeout
+    )
+    response.raise_for_status()
+    _record_latency(provider, time.monotonic() - started)
+    return _loads(response.content)
+
+
+def _complete(prompt: str) -> str:
+    """Send a raw prompt to the configured provider and return its reply"""
     if AI_PROVIDER == "ollama":
+        data = _post_json(
+            f"{OLLAMA_ENDPOINT}/api/generate",
+            {
+                "model": OLLAMA_MODEL,
+                "prompt": prompt,
+                "stream": False,
+                "options": {"temperature": 0.1, "top_p": 0.9},
+            },
+            "ollama",
+        )
+        return data["response"]
+
+    data = _post_json(
+        AI_ENDPOINT, {"messages": [{"role": "user", "content": prompt}]}, "hackclub"
+    )
+    return data["choices"][0]["message"]["content"]
+
+
+def _is_yes(answer: str) -> bool:
+    """True if the first whole-word yes/no in the reply is a yes"""
+    match = _YESNO.search(answer)
+    return bool(match) and match.group(1).lower() == "yes"
+
+
+def _cache_key(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+def clear_verify_cache() -> None:
+    """Forget every cached verdict, e.g. after switching provider, model or prompt"""
+    global _cache_hits, _cache_misses
+    with _VERIFY_CACHE_LOCK:
+        _VERIFY_CACHE.clear()
+        _cache_hits = _cache_misses = 0
+
+
+def verify_ai(given_answer: str, correct_answer: str) -> bool:
+    global _cache_hits, _cache_misses
+
+    key = (_cache_key(given_answer), _cache_key(correct_answer))
+    if AI_VERIFY_CACHE:
+        with _VERIFY_CACHE_LOCK:
+            if key in _VERIFY_CACHE:
+                _VERIFY_CACHE.move_to_end(key)
+                _cache_hits += 1
+                return _VERIFY_CACHE[key]
+            _cache_misses += 1
+            if (_cache_hits + _cache_misses) % 100 == 0:
+                logger.debug(
+                    f"Verify cache: {_cache_hits} hits, {_cache_misses} misses"
+                )
+
+    try:
+        try:
+            result = _verify_with(AI_PROVIDER, given_answer, correct_answer)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            if not AI_FAILOVER:
+                raise
+            logger.warning(f"{AI_PROVIDER} unavailable, failing over: {e}")
+            result = _verify_fallback(given_answer, correct_answer)
+    except requests.exceptions.RequestException as e:
+        logger.error(f"{AI_PROVIDER} request failed: {e}")
+        return given_answer.lower().strip() == correct_answer.lower().strip()
+    except (KeyError, IndexError, ValueError) as e:
+        logger.error(f"{AI_PROVIDER} response PARSING failed: {e}")
+        return given_answer.lower().strip() == correct_answer.lower().strip()
+
+    # only real verdicts are cached, never the fallbacks above
+    if AI_VERIFY_CACHE:
+        with _VERIFY_CACHE_LOCK:
+            _VERIFY_CACHE[key] = result
+            if len(_VERIFY_CACHE) > AI_VERIFY_CACHE_SIZE:
+                _VERIFY_CACHE.popitem(last=False)
+    return result
+
+
+def _verify_with(provider: str, given_answer: str, correct_answer: str) -> bool:
+    if provider == "ollama":
         return verify_ollama(given_answer, correct_answer)
     return verify_hackclub(given_answer, correct_answer)
 
 
+def _verify_fallback(given_answer: str, correct_answer: str) -> bool:
+    """Verify with whichever provider isn't configured"""
+    provider = "hackclub" if AI_PROVIDER == "ollama" else "ollama"
+    return _verify_with(provider, given_answer, correct_answer)
+
+
 def verify_hackclub(given_answer: str, correct_answer: str) -> bool:
     endpoint = AI_ENDPOINT
-    response = requests.post(
+    data = _post_json(
         endpoint,
-        json={
+        {
             "messages": [
                 {
                     "role": "user",
@@ -36,15 +301,16 @@ def verify_hackclub(given_answer: str, correct_answer: str) -> bool:
                 }
             ]
         },
+        "hackclub",
     )
-    answer = response.json()["choices"][0]["message"]["content"]
+    answer = data["choices"][0]["message"]["content"]
     if len(answer) > 3:
         logger.warning(f"AI response too long: {answer}")
-    if "yes" in answer and "no" in answer:
+    if len(_YESNO.findall(answer)) > 1:
         logger.error(
             f"AI response is ambiguous: {answer} and probably will cause issues! fix now!"
         )
-    return "yes" in answer.lower()
+    return _is_yes(answer)
 
 
 def verify_ollama(given_answer: str, correct_answer: str) -> bool:
@@ -52,31 +318,22 @@ def verify_ollama(given_answer: str, correct_answer: str) -> bool:
     endpoint = f"{OLLAMA_ENDPOINT}/api/generate"
     prompt = f"Is ```{given_answer}``` correct, if the correct answer is ```{correct_answer}```? Respond with only `yes` or `no`."
 
-    try:
-        response = requests.post(
-            endpoint,
-            json={
-                "model": OLLAMA_MODEL,
-                "prompt": prompt,
-                "stream": False,
-                "options": {"temperature": 0.1, "top_p": 0.9, "max_tokens": 10},
-            },
-            timeout=10,
-        )
-        response.raise_for_status()
-
-        answer = response.json()["response"].strip()
-        if len(answer) > 3:
-            logger.warning(f"Ollama response too long: {answer}")
-        if "yes" in answer and "no" in answer:
-            logger.error(
-                f"Ollama response is ambiguous: {answer} and probably will cause issues! fix now!"
-            )
-        return "yes" in answer.lower()
+    data = _post_json(
+        endpoint,
+        {
+            "model": OLLAMA_MODEL,
+            "prompt": prompt,
+            "stream": False,
+            "options": {"temperature": 0.1, "top_p": 0.9, "max_tokens": 10},
+        },
+        "ollama",
+    )
 
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Ollama request failed: {e}")
-        return given_answer.lower().strip() == correct_answer.lower().strip()
-    except (KeyError, ValueError) as e:
-        logger.error(f"Ollama response PARSING failed: {e}")
-        return given_answer.lower().strip() == correct_answer.lower().strip()
+    answer = data["response"].strip()
+    if len(answer) > 3:
+        logger.warning(f"Ollama response too long: {answer}")
+    if len(_YESNO.findall(answer)) > 1:
+        logger.error(
+            f"Ollama response is ambiguous: {answer} and probably will cause issues! fix now!"
+        )
+    return _is_yes(answer)
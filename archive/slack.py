@@ -1,14 +1,23 @@
+import collections
 import datetime
+import json
 import os
+import re
 import sys
 import time
 import threading
 import html
+from typing import Callable, Iterable, Iterator, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import ConnectionErrorRetryHandler
 import logging
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.triggers.interval import IntervalTrigger
 from instance import (
     Instance,
@@ -21,12 +30,18 @@ from instance import (
 )
 
 # import yaml
-from utils import purge_channel_messages, get_trivia_question, get_riddle
+from utils import (
+    RateLimiter,
+    purge_channel_messages,
+    get_trivia_question,
+    get_riddle,
+)
 from config import (
     two_player_config,
     multi_player_config,
     host_dialogue,
     dialogue_timing,
+    SERVER_DEFAULTS,
 )
 import random
 
@@ -55,18 +70,191 @@ LOBBY_CHANNEL_ID = os.environ.get("LOBBY_CHANNEL_ID")
 if not LOBBY_CHANNEL_ID:
     raise ValueError("LOBBY_CHANNEL_ID environment variable must be set")
 
+SLACK_TIMEOUT = int(os.environ.get("SLACK_TIMEOUT", 30))  # seconds per API call
+
+# one client shared by every handler, job and pool worker
+# 429s are not retried here - that would sleep on whichever thread made the
+# call, Bolt handler threads included. slack_call/slack_fetch handle them instead
+SLACK_CLIENT = WebClient(
+    token=os.environ.get("SLACK_BOT_TOKEN"),
+    timeout=SLACK_TIMEOUT,
+    retry_handlers=[ConnectionErrorRetryHandler()],
+)
 app = App(
     token=os.environ.get("SLACK_BOT_TOKEN"),
     signing_secret=os.environ.get("SLACK_SIGNING_SECRET"),
+    client=SLACK_CLIENT,
 )
 
-BOT_ID = app.client.auth_test()["user_id"]
+# every web API call is made through slack_call/slack_fetch, so this bounds how
+# many are in flight across handlers, jobs and pool workers
+SLACK_TIER2 = threading.BoundedSemaphore(20)
+SLACK_MAX_RETRIES = 2  # per call, on 429
+
+
+def _retry_after(error: SlackApiError) -> Optional[float]:
+    """Seconds Slack asked us to wait, or None if it wasn't a rate limit"""
+    if error.response.status_code != 429:
+        return None
+    for name, value in error.response.headers.items():
+        if name.lower() == "retry-after":
+            return float(value)
+    return 1.0
+
 
-CURRENTLY_WAITING = []  # [user_id, ...]
+def slack_fetch(fn: Callable, *args, **kwargs):
+    """Call a Slack API method and return its result, waiting out Retry-After
+    on a 429. Blocks the calling thread - only for EXEC workers, scheduler jobs
+    and startup, never a Bolt handler thread"""
+    for attempt in range(SLACK_MAX_RETRIES + 1):
+        try:
+            with SLACK_TIER2:
+                return fn(*args, **kwargs)
+        except SlackApiError as e:
+            retry_after = _retry_after(e)
+            if retry_after is None or attempt == SLACK_MAX_RETRIES:
+                raise
+        # sleep outside the semaphore so other calls keep going meanwhile
+        time.sleep(retry_after)
+
+
+BOT_ID = slack_fetch(app.client.auth_test)["user_id"]
+PROTECTED_USERS = frozenset({ADMIN_ID, BOT_ID})  # never kicked during cleanup
+
+# how far back (in seconds) to look for old bot messages to purge from the lobby
+LOBBY_PURGE_WINDOW = int(os.environ.get("LOBBY_PURGE_WINDOW", 86400))
+
+# user_id: time joined - ordered by arrival, with O(1) membership and removal
+CURRENTLY_WAITING = collections.OrderedDict()
 INSTANCES = {}  # channel_id: Instance
-ROUND_TIMERS = {}  # channel_id: Timer
+# channel_ids of instances that may still be WAITING - entries are dropped
+# once their game starts or they fill up
+_FREE_INSTANCES = collections.deque()
+MAX_PLAYERS_PER_GAME = SERVER_DEFAULTS["max_players_per_game"]
+_STATE_COUNTS = collections.Counter()  # GameState: number of instances
+_WAITLIST_LOCK = threading.Lock()
+# state changes arrive on handler and scheduler threads - guards the two above
+# (short holds only, never around a slack call)
+_FREE_LOCK = threading.Lock()
+
+# display strings that never change - built once instead of in every handler
+GAME_TYPE_TITLES = {gt.value: gt.value.replace("_", " ").title() for gt in GameType}
+AVAILABLE_GAME_TYPES_STR = ", ".join(GAME_TYPE_TITLES.values())
+PLAYER_STATE_EMOJI = {PlayerState.ACTIVE: "✓", PlayerState.WINNER: "★"}
+_ROUND_TEMPLATE = (
+    "**Round {round} - {title}**\n\n"
+    "**{question}**\n\n"
+    "Time limit: {time_limit} seconds\n"
+    "Just type your answer in the chat!"
+)
+HOST_DIALOGUE_FORMATTED = {
+    key: [f"**HOST:** {line}" for line in lines] for key, lines in host_dialogue.items()
+}
+
+# web API calls that handlers don't need to wait on go through here, so the
+# socket-mode listener isn't held up by Slack round-trips
+EXEC = ThreadPoolExecutor(max_workers=16, thread_name_prefix="voyager_slack")
+# chat.delete and conversations.kick are tier 3 (~50/min) - pace them here
+# rather than firing at full speed and stalling on Retry-After for every 429
+SLACK_TIER3_RATE = 50 / 60
+_DELETE_LIMITER = RateLimiter(rate=SLACK_TIER3_RATE, burst=10)
+_KICK_LIMITER = RateLimiter(rate=SLACK_TIER3_RATE, burst=10)
+_DELETE_SLOTS = threading.BoundedSemaphore(4)  # deletes in flight at once
+# /admin-purge runs on EXEC and waits on its deletes - they need their own pool,
+# or enough concurrent purges would fill EXEC waiting on work queued behind them
+_PURGE_EXEC = ThreadPoolExecutor(max_workers=4, thread_name_prefix="voyager_purge")
+
+# instance channels left clean by the last startup, so the next one can skip them
+INIT_CHECKPOINT_PATH = os.environ.get("VOYAGER_INIT_CHECKPOINT", ".voyager_init.json")
+_CLEAN_CHANNELS = {}  # channel_id -> channel metadata when it was last left clean
+_CHECKPOINT_LOCK = threading.Lock()
+
+# also drives host dialogue, so give it more workers than the default 10
+scheduler = BackgroundScheduler(
+    executors={"default": {"type": "threadpool", "max_workers": 20}}
+)
+
+
+def slack_call(fn: Callable, *args, _retries: int = SLACK_MAX_RETRIES, **kwargs):
+    """Fire a Slack API call whose result the caller doesn't need. On a 429 the
+    retry is handed to the scheduler to run after Retry-After, so the calling
+    thread (often a Bolt handler) never sleeps"""
+    try:
+        with SLACK_TIER2:
+            fn(*args, **kwargs)
+    except SlackApiError as e:
+        retry_after = _retry_after(e)
+        if retry_after is None or _retries <= 0:
+            raise
+        logger.debug(f"Rate limited, retrying in {retry_after}s")
+        scheduler.add_job(
+            slack_call,
+            "date",
+            run_date=datetime.datetime.now() + datetime.timedelta(seconds=retry_after),
+            args=[fn, *args],
+            kwargs={**kwargs, "_retries": _retries - 1},
+            misfire_grace_time=30,
+        )
+
 
-scheduler = BackgroundScheduler()
+# slack metadata rarely changes, so keep lookups around for a few minutes
+SLACK_META_TTL = 300
+_SLACK_META = {}  # (method, channel_id): (expires_at, value)
+_SLACK_META_LOCK = threading.Lock()
+
+
+def _cached_slack_meta(method: str, channel_id: str, fetch):
+    key = (method, channel_id)
+    now = time.monotonic()
+    with _SLACK_META_LOCK:
+        entry = _SLACK_META.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+
+    value = fetch()
+    with _SLACK_META_LOCK:
+        _SLACK_META[key] = (now + SLACK_META_TTL, value)
+    return value
+
+
+def get_channel_info(channel_id: str) -> dict:
+    """conversations_info, cached for SLACK_META_TTL seconds"""
+    return _cached_slack_meta(
+        "info",
+        channel_id,
+        lambda: slack_fetch(app.client.conversations_info, channel=channel_id)[
+            "channel"
+        ],
+    )
+
+
+def _fetch_all_members(channel_id: str) -> frozenset:
+    members = []
+    cursor = None
+    while True:
+        result = slack_fetch(
+            app.client.conversations_members,
+            channel=channel_id,
+            limit=200,
+            cursor=cursor,
+        )
+        members.extend(result["members"])
+        cursor = result.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            return frozenset(members)
+
+
+def get_channel_members(channel_id: str) -> frozenset:
+    """Every member of a channel (all pages), cached for SLACK_META_TTL seconds"""
+    return _cached_slack_meta(
+        "members", channel_id, lambda: _fetch_all_members(channel_id)
+    )
+
+
+def invalidate_channel_members(channel_id: str):
+    """Drop cached membership after an invite, kick, or join"""
+    with _SLACK_META_LOCK:
+        _SLACK_META.pop(("members", channel_id), None)
 
 
 def generate_challenge(game_type: GameType) -> Challenge:
@@ -90,6 +278,7 @@ def generate_challenge(game_type: GameType) -> Challenge:
         )
 
     elif game_type == GameType.TRIVIA:
+        # already unescaped by get_trivia_question
         question, answers = get_trivia_question()
         return Challenge(
             challenge_type=game_type,
@@ -103,7 +292,8 @@ def generate_challenge(game_type: GameType) -> Challenge:
         return Challenge(
             challenge_type=game_type,
             question=riddle,
-            correct_answer=answer,
+            # unescape once here rather than every time results are shown
+            correct_answer=html.unescape(answer),
             time_limit=15,
         )
 
@@ -116,19 +306,98 @@ def generate_challenge(game_type: GameType) -> Challenge:
         )
 
 
-def send_host_message(channel_id: str, dialogue_key: str):
-    """Send host dialogue to Slack channel"""
+def _post_host_line(channel_id: str, text: str):
+    try:
+        slack_call(app.client.chat_postMessage, channel=channel_id, text=text)
+    except Exception as e:
+        logger.error(f"Failed to send host message: {e}")
+
+
+def send_host_message(
+    channel_id: str, dialogue_key: str, then: Optional[Callable[[], None]] = None
+):
+    """Queue host dialogue for a Slack channel without blocking the caller.
+    Lines are posted wait_time apart by the scheduler; `then` runs after the last one."""
     wait_time = dialogue_timing.get(
         dialogue_key, dialogue_timing.get("default_wait", 2.0)
     )
-    dialogue_lines = host_dialogue.get(dialogue_key, [])
+    dialogue_lines = HOST_DIALOGUE_FORMATTED.get(dialogue_key, [])
+
+    start = datetime.datetime.now()
+    for i, line in enumerate(dialogue_lines):
+        scheduler.add_job(
+            _post_host_line,
+            "date",
+            run_date=start + datetime.timedelta(seconds=i * wait_time),
+            args=[channel_id, line],
+            misfire_grace_time=30,
+        )
+    if then:
+        scheduler.add_job(
+            then,
+            "date",
+            run_date=start
+            + datetime.timedelta(seconds=len(dialogue_lines) * wait_time),
+            misfire_grace_time=30,
+        )
+
+
+def post_batched(channel_id: str, parts: List[str]):
+    """Post several sections as a single Slack message"""
+    slack_call(
+        app.client.chat_postMessage,
+        channel=channel_id,
+        text="\n\n".join(part for part in parts if part),
+    )
+
 
-    for line in dialogue_lines:
+def _format_round_message(instance: Instance, challenge: Challenge) -> str:
+    return _ROUND_TEMPLATE.format(
+        round=instance.current_round,
+        title=GAME_TYPE_TITLES[challenge.challenge_type.value],
+        question=challenge.question,
+        time_limit=challenge.time_limit,
+    )
+
+
+def start_round_with_banter(channel_id: str):
+    """Start the next main round and schedule its autoeval.
+    main_round banter is quick-fire, so it goes out with the question as one message."""
+    # looked up when the job fires - the game may have ended in the meantime
+    instance = INSTANCES.get(channel_id)
+    if not instance or instance.state != GameState.IN_PROGRESS:
+        return
+
+    challenge = instance.start_main_round()
+    post_batched(
+        channel_id,
+        [
+            "\n".join(HOST_DIALOGUE_FORMATTED.get("main_round", [])),
+            _format_round_message(instance, challenge),
+        ],
+    )
+    schedule_autoeval(channel_id, challenge.time_limit + 2)
+
+
+def schedule_autoeval(channel_id: str, delay: float):
+    """(Re)schedule the current round's auto-evaluation for a channel"""
+    scheduler.add_job(
+        auto_evaluate_round,
+        "date",
+        run_date=datetime.datetime.now() + datetime.timedelta(seconds=delay),
+        args=[channel_id],
+        id=f"autoeval-{channel_id}",
+        replace_existing=True,
+    )
+
+
+def cancel_round_jobs(channel_id: str):
+    """Drop any pending auto-evaluation or next-round start for a channel"""
+    for job_id in (f"autoeval-{channel_id}", f"round-{channel_id}"):
         try:
-            app.client.chat_postMessage(channel=channel_id, text=f"**HOST:** {line}")
-            time.sleep(wait_time)
-        except Exception as e:
-            logger.error(f"Failed to send host message: {e}")
+            scheduler.remove_job(job_id)
+        except JobLookupError:
+            pass
 
 
 def create_game_config(player_count: int) -> GameConfig:
@@ -161,16 +430,16 @@ def auto_evaluate_round(channel_id: str):
             return
 
         message_parts = [
-            f"**Time's up! Results for {results['challenge_type'].replace('_', ' ').title()}**\n"
+            f"**Time's up! Results for {GAME_TYPE_TITLES[results['challenge_type']]}**\n"
         ]
 
         # Show the correct answer
         if instance.current_challenge and instance.current_challenge.correct_answer:
             correct_answer = instance.current_challenge.correct_answer
             if isinstance(correct_answer, list):
-                answer_text = " / ".join([html.unescape(str(ans)) for ans in correct_answer])
+                answer_text = " / ".join(str(ans) for ans in correct_answer)
             else:
-                answer_text = html.unescape(str(correct_answer))
+                answer_text = str(correct_answer)
             message_parts.append(f"**Correct Answer:** {answer_text}")
 
         if results["correct_players"]:
@@ -191,62 +460,86 @@ def auto_evaluate_round(channel_id: str):
             f"\n**Current Status:**\nActive players: {game_state['active_players']}\nRounds left: {rounds_left}"
         )
 
-        app.client.chat_postMessage(channel=channel_id, text="\n".join(message_parts))
+        slack_call(
+            app.client.chat_postMessage,
+            channel=channel_id,
+            text="\n".join(message_parts),
+        )
 
         # check for end state
         if instance.current_round >= instance.config.main_rounds:
             final_results = instance.end_game(success=True)
-            send_host_message(channel_id, "final_results")
-
             winners_text = ", ".join([f"<@{uid}>" for uid in final_results["winners"]])
-            app.client.chat_postMessage(
-                channel=channel_id,
-                text=f"**Game Complete!**\n\nWinners: {winners_text}",
-            )
 
-            send_host_message(channel_id, "outro")
-        else:
-            # schedule next round
-            def start_next():
-                send_host_message(channel_id, "main_round")
-                challenge = instance.start_main_round()
-                app.client.chat_postMessage(
+            def announce_winners():
+                slack_call(
+                    app.client.chat_postMessage,
                     channel=channel_id,
-                    text=f"**Round {instance.current_round} - {challenge.challenge_type.value.replace('_', ' ').title()}**\n\n"
-                    f"**{challenge.question}**\n\n"
-                    f"Time limit: {challenge.time_limit} seconds\n"
-                    f"Just type your answer in the chat!",
+                    text=f"**Game Complete!**\n\nWinners: {winners_text}",
                 )
-                # schedule autoeval
-                timer = threading.Timer(
-                    challenge.time_limit + 2, lambda: auto_evaluate_round(channel_id)
-                )
-                ROUND_TIMERS[channel_id] = timer
-                timer.start()
+                send_host_message(channel_id, "outro")
 
-            timer = threading.Timer(3, start_next)
-            ROUND_TIMERS[channel_id] = timer
-            timer.start()
+            send_host_message(channel_id, "final_results", then=announce_winners)
+        else:
+            # schedule next round
+            scheduler.add_job(
+                start_round_with_banter,
+                "date",
+                run_date=datetime.datetime.now() + datetime.timedelta(seconds=3),
+                args=[channel_id],
+                id=f"round-{channel_id}",
+                replace_existing=True,
+            )
 
     except Exception as e:
         logger.error(f"Auto-evaluation failed in {channel_id}: {e}")
-        app.client.chat_postMessage(
-            channel=channel_id, text=f"Auto-evaluation failed: {e}"
+        slack_call(
+            app.client.chat_postMessage,
+            channel=channel_id,
+            text=f"Auto-evaluation failed: {e}",
         )
 
 
+def _drop_free_instance(channel_id: str):
+    """Drop channel_id from the head of the free queue - a no-op if another
+    thread already took it, so a different free instance is never lost"""
+    with _FREE_LOCK:
+        if _FREE_INSTANCES and _FREE_INSTANCES[0] == channel_id:
+            _FREE_INSTANCES.popleft()
+
+
+def _on_state_change(channel_id: str, old_state: GameState, new_state: GameState):
+    with _FREE_LOCK:
+        _STATE_COUNTS[old_state] -= 1
+        _STATE_COUNTS[new_state] += 1
+    if old_state == GameState.WAITING:
+        # game started in the instance next in line - drop it right away
+        _drop_free_instance(channel_id)
+
+
 def create_instance_with_dialogue(channel_id: str, name: str) -> Instance:
     """Create a new instance with framework-specific setup"""
     instance = Instance(channel_id, name)
     instance.set_challenge_generator(generate_challenge)
+    instance.set_state_listener(
+        lambda old_state, new_state: _on_state_change(channel_id, old_state, new_state)
+    )
+    with _FREE_LOCK:
+        _STATE_COUNTS[instance.state] += 1
     return instance
 
 
+# https://hackclub.slack.com/archives/[channel_id]/p[seconds][microseconds]
+_MSG_LINK_RE = re.compile(r"/archives/(?P<cid>[A-Z0-9]+)/p(?P<ts>\d{10})(?P<us>\d{6})")
+
+
 def create_instance_channel(name: str) -> str:
     """Create a new private channel for an instance - do not use dynamically unless controlled!
     Use the admin-create command instead."""
     channel_name = f"v-inst-{name}"
-    result = app.client.conversations_create(name=channel_name, is_private=True)
+    result = slack_fetch(
+        app.client.conversations_create, name=channel_name, is_private=True
+    )
     channel_id = result["channel"]["id"]
     return channel_id
 
@@ -268,20 +561,24 @@ def admin_delmessage(ack, command, respond):
         )
         return
 
-    try:
-        # https://hackclub.slack.com/archives/[channel_id]/p[timestamp]
-        parts = message_link.split("/")
-        channel_id = parts[-2]
-        ts = parts[-1][1:]  # grab timestamp
-        ts = f"{ts[:-6]}.{ts[-6:]}"  # insert decimal point
+    match = _MSG_LINK_RE.search(message_link)
+    if not match:
+        respond("Invalid message link format.", response_type="ephemeral")
+        return
+
+    channel_id, ts = match["cid"], f"{match['ts']}.{match['us']}"
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug(
-            f"Deleting message from {channel_id} at {datetime.datetime.fromtimestamp(int(ts))}"
+            f"Deleting message from {channel_id} at {datetime.datetime.fromtimestamp(int(match['ts']))}"
         )
+    # a rate-limited delete waits out Retry-After - keep that off the handler thread
+    EXEC.submit(_do_delmessage, channel_id, ts, message_link, respond)
+
 
-        app.client.chat_delete(channel=channel_id, ts=ts)
+def _do_delmessage(channel_id: str, ts: str, message_link: str, respond):
+    try:
+        slack_fetch(app.client.chat_delete, channel=channel_id, ts=ts)
         respond(f"Deleted message from {message_link}", response_type="ephemeral")
-    except (IndexError, ValueError):
-        respond("Invalid message link format.", response_type="ephemeral")
     except Exception as e:
         respond(f"Deletion failed: {str(e)}", response_type="ephemeral")
 
@@ -290,11 +587,26 @@ def admin_delmessage(ack, command, respond):
 def admin_create_instance(ack, command, say):
     """Manually create a new instance channel - admin only"""
     ack()
-    name = command["text"]
-    channel_id = create_instance_channel(name)
-    say(f"Created instance {name} in channel {channel_id}")
+    # creating the channel needs its result, so it runs where it may wait
+    EXEC.submit(_do_create_instance, command["text"], say)
+
+
+def _do_create_instance(name: str, say):
+    try:
+        channel_id = create_instance_channel(name)
+    except Exception as e:
+        logger.error(f"Failed to create instance {name}: {e}")
+        slack_call(say, f"Failed to create instance {name}: {e}")
+        return
+    slack_call(say, f"Created instance {name} in channel {channel_id}")
     INSTANCES[channel_id] = create_instance_with_dialogue(channel_id, name)
-    app.client.conversations_invite(channel=channel_id, users=[ADMIN_ID, BOT_ID])
+    with _FREE_LOCK:
+        _FREE_INSTANCES.append(channel_id)
+    schedule_waitlist()
+    slack_fetch(
+        app.client.conversations_invite, channel=channel_id, users=[ADMIN_ID, BOT_ID]
+    )
+    invalidate_channel_members(channel_id)
 
 
 @app.command("/admin-purge")
@@ -307,7 +619,7 @@ def admin_purge_instance(ack, command, respond):
         return
 
     channel_id = command["channel_id"]
-    user_filter = command["text"].strip() if command["text"].strip() else None
+    user_filter = command["text"].strip() or None
 
     if channel_id not in INSTANCES:
         respond(
@@ -316,8 +628,21 @@ def admin_purge_instance(ack, command, respond):
         )
         return
 
+    respond("Purging messages...", response_type="ephemeral")
+    # can take well past Slack's 3s window - respond() stays valid for 30 minutes
+    EXEC.submit(_do_purge, channel_id, user_filter, respond)
+
+
+def _do_purge(channel_id: str, user_filter: Optional[str], respond):
     try:
-        result = purge_channel_messages(app, channel_id, user_filter)
+        result = purge_channel_messages(
+            app,
+            channel_id,
+            user_filter,
+            executor=_PURGE_EXEC,
+            limiter=_DELETE_LIMITER,
+            call=slack_fetch,
+        )
 
         if result["success"]:
             respond(
@@ -334,39 +659,70 @@ def admin_purge_instance(ack, command, respond):
         respond(f"Failed to purge messages: {str(e)}", response_type="ephemeral")
 
 
+def schedule_waitlist():
+    """Process the waitlist as soon as possible, off the calling thread"""
+    EXEC.submit(process_waitlist)
+
+
 def process_waitlist():
     """Auto-assign users in the waitlist to instances"""
     if not CURRENTLY_WAITING:
         logger.debug("No users in waitlist")
         return
 
+    # runs can be triggered from several threads at once, so only one places users
+    with _WAITLIST_LOCK:
+        _process_waitlist()
+
+
+def _process_waitlist():
+    if not CURRENTLY_WAITING:
+        return
+
     logger.info(f"Processing waitlist with {len(CURRENTLY_WAITING)} users")
 
     try:
-        if len(CURRENTLY_WAITING) >= 1:
-            # utilize existing instances - if none available, keep waiting
-            for user in CURRENTLY_WAITING:
-                for channel_id, instance in INSTANCES.items():
-                    if instance.state == GameState.WAITING:
-                        instance.add_player(user)
-                        try:
-                            app.client.conversations_invite(
-                                channel=channel_id, users=[user]
-                            )
-                            app.client.chat_postMessage(
-                                channel=channel_id,
-                                text=f"Welcome <@{user}>! You can invite others to join this game using `/invitevoyage`",
-                            )
-                        except Exception as e:
-                            error_str = str(e)
-                            if "already_in_channel" not in error_str:
-                                logger.error(
-                                    f"Failed to invite user {user} to channel {channel_id}: {e}"
-                                )
-                                # alerady_in_channel should only occur if it's admin user - this might be a footgun
-                                raise
-                        CURRENTLY_WAITING.remove(user)
-                        break
+        # utilize existing instances - if none available, keep waiting
+        while CURRENTLY_WAITING:
+            with _FREE_LOCK:
+                if not _FREE_INSTANCES:
+                    break
+                channel_id = _FREE_INSTANCES[0]
+            instance = INSTANCES.get(channel_id)
+            if (
+                not instance
+                or instance.state != GameState.WAITING
+                or len(instance.players) >= MAX_PLAYERS_PER_GAME
+            ):
+                _drop_free_instance(channel_id)
+                continue
+
+            user, joined_at = CURRENTLY_WAITING.popitem(last=False)
+            instance.add_player(user)
+            mark_channel_dirty(channel_id)
+            try:
+                # the member cache can lag behind leaves - let Slack decide
+                slack_fetch(
+                    app.client.conversations_invite,
+                    channel=channel_id,
+                    users=[user],
+                )
+                invalidate_channel_members(channel_id)
+                slack_call(
+                    app.client.chat_postMessage,
+                    channel=channel_id,
+                    text=f"Welcome <@{user}>! You can invite others to join this game using `/invitevoyage`",
+                )
+            except Exception as e:
+                error_str = str(e)
+                if "already_in_channel" not in error_str:
+                    logger.error(
+                        f"Failed to invite user {user} to channel {channel_id}: {e}"
+                    )
+                    # alerady_in_channel should only occur if it's admin user - this might be a footgun
+                    CURRENTLY_WAITING[user] = joined_at
+                    CURRENTLY_WAITING.move_to_end(user, last=False)
+                    raise
 
     except Exception as e:
         logger.error(f"Failed to process waitlist: {e}")
@@ -374,7 +730,8 @@ def process_waitlist():
 
 scheduler.add_job(
     process_waitlist,
-    trigger=IntervalTrigger(seconds=30),  # TODO: configurable
+    # safety net only - joins and freed instances trigger processing directly
+    trigger=IntervalTrigger(minutes=5),  # TODO: configurable
     id="process_waitlist",
     name="Process users in waitlist",
     replace_existing=True,
@@ -402,54 +759,70 @@ def start_game(ack, command, say, respond):
         config = create_game_config(len(instance.players))
         game_state = instance.start_game(config)
 
-        send_host_message(channel_id, "intro")
-
-        say(
-            f"**Game Starting!**\n\n"
-            f"Use `/next-round` to begin the first challenge!\n"
-            f"After that, rounds will progress automatically.\n\n"
-            f"**Game Status:** {game_state}"
+        send_host_message(
+            channel_id,
+            "intro",
+            then=lambda: slack_call(
+                say,
+                f"**Game Starting!**\n\n"
+                f"Use `/next-round` to begin the first challenge!\n"
+                f"After that, rounds will progress automatically.\n\n"
+                f"**Game Status:** {game_state}"
+            ),
         )
     except Exception as e:
         respond(f"Failed to start game: {e}", response_type="ephemeral")
 
 
+def react_to_answer(channel_id: str, ts: str):
+    """Acknowledge a submitted answer with a reaction"""
+    try:
+        slack_call(
+            app.client.reactions_add,
+            channel=channel_id,
+            timestamp=ts,
+            name="white_check_mark",
+        )
+    except Exception as e:
+        logger.debug(f"Failed to add reaction: {e}")
+
+
 @app.message("")
 def handle_message(message, say):
     """Handle natural chat messages as answers and start commands"""
-    user_id = message["user"]
+    # only process messages in instance channels - everything else stops here
     channel_id = message["channel"]
-    text = message.get("text", "").strip().lower()
-
-    logging.debug("received message")
-
-    if user_id == BOT_ID or not text:
+    instance = INSTANCES.get(channel_id)
+    if instance is None:
         return
 
-    # only process messages in instance channels
-    instance = INSTANCES.get(channel_id)
-    if not instance:
+    user_id = message.get("user")
+    text = message.get("text", "").strip().lower()
+    if user_id == BOT_ID or not user_id or not text:
         return
 
     if text == "start":
         if instance.state != GameState.WAITING:
-            say("The game has already started!", thread_ts=message["ts"])
+            slack_call(say, "The game has already started!", thread_ts=message["ts"])
             return
 
         try:
             config = create_game_config(len(instance.players))
             game_state = instance.start_game(config)
 
-            send_host_message(channel_id, "intro")
-
-            say(
-                f"**Game Starting!**\n\n"
-                f"Use `/next-round` to begin the first challenge!\n"
-                f"After that, rounds will progress automatically.\n\n"
-                f"**Game Status:** {game_state}"
+            send_host_message(
+                channel_id,
+                "intro",
+                then=lambda: slack_call(
+                    say,
+                    f"**Game Starting!**\n\n"
+                    f"Use `/next-round` to begin the first challenge!\n"
+                    f"After that, rounds will progress automatically.\n\n"
+                    f"**Game Status:** {game_state}"
+                ),
             )
         except Exception as e:
-            say(f"Failed to start game: {e}", thread_ts=message["ts"])
+            slack_call(say, f"Failed to start game: {e}", thread_ts=message["ts"])
         return
 
     if instance.state != GameState.IN_PROGRESS or not instance.current_challenge:
@@ -461,13 +834,7 @@ def handle_message(message, say):
         return
 
     instance.submit_answer(user_id, text)
-
-    try:
-        app.client.reactions_add(
-            channel=channel_id, timestamp=message["ts"], name="white_check_mark"
-        )
-    except Exception as e:
-        logger.debug(f"Failed to add reaction: {e}")
+    EXEC.submit(react_to_answer, channel_id, message["ts"])
 
 
 @app.command("/answer")
@@ -518,11 +885,13 @@ def join_game(ack, command, respond):
         )
         return
 
-    if user_id in CURRENTLY_WAITING:
+    # setdefault is a single atomic step, so two quick /waitlist calls can't both add
+    joined_at = time.time()
+    if CURRENTLY_WAITING.setdefault(user_id, joined_at) is not joined_at:
         respond(f"<@{user_id}> You're already in a queue!", response_type="ephemeral")
         return
 
-    CURRENTLY_WAITING.append(user_id)
+    schedule_waitlist()
     respond(
         f"<@{user_id}> You've been added to the queue! Use `/state` to check queue status.",
         response_type="ephemeral",
@@ -540,17 +909,17 @@ def status(ack, command, respond):
             "Please use this command in the lobby or a game instance!",
             response_type="ephemeral",
         )
-        logger.info(f"State command in channel {channel_id}, INSTANCES: {INSTANCES}")
+        logger.info(f"State command in channel {channel_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            # repr of every instance - only build it when it'll be shown
+            logger.debug(f"INSTANCES: {INSTANCES}")
         return
 
     if channel_id == LOBBY_CHANNEL_ID:
         waiting_count = len(CURRENTLY_WAITING)
-        active_instances = sum(
-            1 for inst in INSTANCES.values() if inst.state == GameState.IN_PROGRESS
-        )
-        waiting_instances = sum(
-            1 for inst in INSTANCES.values() if inst.state == GameState.WAITING
-        )
+        with _FREE_LOCK:
+            active_instances = _STATE_COUNTS[GameState.IN_PROGRESS]
+            waiting_instances = _STATE_COUNTS[GameState.WAITING]
 
         status_msg = [
             "**Current Status**",
@@ -570,10 +939,7 @@ def status(ack, command, respond):
 
         player_status = []
         for user_id, player in instance.players.items():
-            status_emoji = {
-                PlayerState.ACTIVE: "✓",
-                PlayerState.WINNER: "★",
-            }.get(player.state, "")
+            status_emoji = PLAYER_STATE_EMOJI.get(player.state, "")
             player_status.append(
                 f"{status_emoji} <@{user_id}> - Score: {player.score} - Lives: {player.lives}"
             )
@@ -636,27 +1002,10 @@ def start_next_round(ack, command, say, respond):
         return
 
     try:
-        # cancel any existing timer
-        if channel_id in ROUND_TIMERS:
-            ROUND_TIMERS[channel_id].cancel()
-
-        send_host_message(channel_id, "main_round")
-
-        challenge = instance.start_main_round()
-
-        say(
-            f"**Round {instance.current_round} - {challenge.challenge_type.value.replace('_', ' ').title()}**\n\n"
-            f"**{challenge.question}**\n\n"
-            f"Time limit: {challenge.time_limit} seconds\n"
-            f"Just type your answer in the chat!"
-        )
+        # cancel any pending autoeval or round start
+        cancel_round_jobs(channel_id)
 
-        # schedule autoeval
-        timer = threading.Timer(
-            challenge.time_limit + 2, lambda: auto_evaluate_round(channel_id)
-        )
-        ROUND_TIMERS[channel_id] = timer
-        timer.start()
+        start_round_with_banter(channel_id)
 
     except Exception as e:
         respond(f"Failed to start round: {e}", response_type="ephemeral")
@@ -692,16 +1041,16 @@ def evaluate_challenge(ack, command, say, respond):
             return
 
         message_parts = [
-            f"**Results for {results['challenge_type'].replace('_', ' ').title()}**\n"
+            f"**Results for {GAME_TYPE_TITLES[results['challenge_type']]}**\n"
         ]
 
         # Show the correct answer
         if instance.current_challenge and instance.current_challenge.correct_answer:
             correct_answer = instance.current_challenge.correct_answer
             if isinstance(correct_answer, list):
-                answer_text = " / ".join([html.unescape(str(ans)) for ans in correct_answer])
+                answer_text = " / ".join(str(ans) for ans in correct_answer)
             else:
-                answer_text = html.unescape(str(correct_answer))
+                answer_text = str(correct_answer)
             message_parts.append(f"**Correct Answer:** {answer_text}")
 
         if results["correct_players"]:
@@ -722,16 +1071,17 @@ def evaluate_challenge(ack, command, say, respond):
             f"\n**Current Status:**\nActive players: {game_state['active_players']}\nRounds left: {rounds_left}"
         )
 
-        say("\n".join(message_parts))
+        slack_call(say, "\n".join(message_parts))
 
         if instance.current_round >= instance.config.main_rounds:
             final_results = instance.end_game(success=True)
-            send_host_message(channel_id, "final_results")
-
             winners_text = ", ".join([f"<@{uid}>" for uid in final_results["winners"]])
-            say(f"**Game Complete!**\n\nWinners: {winners_text}")
 
-            send_host_message(channel_id, "outro")
+            def announce_winners():
+                slack_call(say, f"**Game Complete!**\n\nWinners: {winners_text}")
+                send_host_message(channel_id, "outro")
+
+            send_host_message(channel_id, "final_results", then=announce_winners)
 
     except Exception as e:
         respond(f"Failed to evaluate challenge: {e}", response_type="ephemeral")
@@ -790,22 +1140,15 @@ def start_specific_game_type(ack, command, say, respond):
     try:
         game_type = GameType(game_type_str.lower())
     except ValueError:
-        available_types = [gt.value.replace("_", " ").title() for gt in GameType]
         respond(
-            f"Invalid game type! Available types: {', '.join(available_types)}",
+            f"Invalid game type! Available types: {AVAILABLE_GAME_TYPES_STR}",
             response_type="ephemeral",
         )
         return
 
     try:
         challenge = instance.start_main_round(game_type)
-
-        say(
-            f"**Round {instance.current_round} - {challenge.challenge_type.value.replace('_', ' ').title()}**\n\n"
-            f"**{challenge.question}**\n\n"
-            f"Time limit: {challenge.time_limit} seconds\n"
-            f"Just type your answer in the chat!"
-        )
+        post_batched(channel_id, [_format_round_message(instance, challenge)])
 
     except Exception as e:
         respond(f"Failed to start round: {e}", response_type="ephemeral")
@@ -814,21 +1157,21 @@ def start_specific_game_type(ack, command, say, respond):
 def ensure_lobby_channel():
     """Make sure the lobby channel exists and the bot is a member"""
     try:
-        channel_info = app.client.conversations_info(channel=LOBBY_CHANNEL_ID)
+        channel_info = get_channel_info(LOBBY_CHANNEL_ID)
         logger.info(
-            f"Found lobby channel: {channel_info['channel']['name']} (Private: {channel_info['channel']['is_private']})"
+            f"Found lobby channel: {channel_info['name']} (Private: {channel_info['is_private']})"
         )
     except Exception as e:
         logger.error(f"Failed to ensure lobby channel's existence: {e}")
         return False
 
-    members = app.client.conversations_members(channel=LOBBY_CHANNEL_ID)["members"]
-    if BOT_ID in members:
+    if BOT_ID in get_channel_members(LOBBY_CHANNEL_ID):
         logger.debug("Voyager is already in lobby channel")
         return True
 
     try:
-        app.client.conversations_join(channel=LOBBY_CHANNEL_ID)
+        slack_fetch(app.client.conversations_join, channel=LOBBY_CHANNEL_ID)
+        invalidate_channel_members(LOBBY_CHANNEL_ID)
         logger.info("Successfully joined lobby channel")
         return True
     except Exception as e:
@@ -836,6 +1179,143 @@ def ensure_lobby_channel():
         return False
 
 
+def rate_limited_delete(channel_id: str, ts: str):
+    with _DELETE_SLOTS, _DELETE_LIMITER:
+        slack_fetch(app.client.chat_delete, channel=channel_id, ts=ts)
+
+
+def rate_limited_kick(channel_id: str, user: str):
+    with _KICK_LIMITER:
+        slack_fetch(app.client.conversations_kick, channel=channel_id, user=user)
+
+
+def iter_history_ts(channel_id: str, predicate=None, **kwargs) -> Iterator[str]:
+    """Timestamps of every message in a channel's history, a page at a time -
+    the next page is only fetched once the caller has consumed this one"""
+    cursor = None
+    while True:
+        history = slack_fetch(
+            app.client.conversations_history,
+            channel=channel_id,
+            limit=200,
+            cursor=cursor,
+            **kwargs,
+        )
+        for message in history["messages"]:
+            if predicate is None or predicate(message):
+                yield message["ts"]
+        cursor = history.get("response_metadata", {}).get("next_cursor")
+        if not history.get("has_more") or not cursor:
+            return
+
+
+def delete_messages(
+    executor: ThreadPoolExecutor, channel_id: str, all_ts: Iterable[str], name: str
+):
+    """Fan chat_delete out over the executor, logging each failure.
+    Returns the number of messages that couldn't be deleted.
+
+    all_ts can be a lazy history stream: each page's deletes are queued before
+    the next page is requested. If the stream raises, the deletes already
+    queued are still waited on before the error propagates."""
+    failed = 0
+    deletes = []
+    try:
+        for ts in all_ts:
+            deletes.append(executor.submit(rate_limited_delete, channel_id, ts))
+    finally:
+        for future in as_completed(deletes):
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                logger.error(f"Failed to delete message in channel {name}: {e}")
+    return failed
+
+
+def cleanup_instance_channel(executor: ThreadPoolExecutor, channel: dict) -> bool:
+    """Kick everyone but the admin and bot from an instance channel and purge it.
+    Returns whether the channel was left fully clean."""
+    to_kick = get_channel_members(channel["id"]) - PROTECTED_USERS
+    if not to_kick:
+        return True
+
+    clean = True
+
+    kicks = {
+        executor.submit(rate_limited_kick, channel["id"], member): member
+        for member in to_kick
+    }
+    for future in as_completed(kicks):
+        try:
+            future.result()
+        except Exception as e:
+            clean = False
+            logger.error(
+                f"Failed to kick user {kicks[future]} from channel {channel['name']}: {e}"
+            )
+    invalidate_channel_members(channel["id"])
+
+    # purge channel messages - deletes start on the first page while the rest load
+    try:
+        failed = delete_messages(
+            executor, channel["id"], iter_history_ts(channel["id"]), channel["name"]
+        )
+    except Exception as e:
+        logger.error(f"Failed to fetch history of channel {channel['name']}: {e}")
+        return False
+    return clean and not failed
+
+
+def channel_metadata(channel: dict) -> dict:
+    """The parts of a conversation object that change when someone touches it"""
+    return {"updated": channel.get("updated"), "num_members": channel.get("num_members")}
+
+
+def fetch_channel_metadata(channel_id: str) -> Optional[dict]:
+    try:
+        result = slack_fetch(
+            app.client.conversations_info, channel=channel_id, include_num_members=True
+        )
+        return channel_metadata(result["channel"])
+    except Exception as e:
+        logger.warning(f"Failed to fetch metadata for channel {channel_id}: {e}")
+        return None
+
+
+def load_init_checkpoint() -> dict:
+    """Instance channels the last run left clean (with their metadata at the
+    time), or nothing on a cold start"""
+    try:
+        with open(INIT_CHECKPOINT_PATH) as f:
+            channels = json.load(f)["channels_initialized"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+    # an id list from before metadata was stored can't be trusted
+    return channels if isinstance(channels, dict) else {}
+
+
+def save_init_checkpoint():
+    with _CHECKPOINT_LOCK:
+        data = {
+            "channels_initialized": dict(sorted(_CLEAN_CHANNELS.items())),
+            "ts": time.time(),
+        }
+        tmp_path = f"{INIT_CHECKPOINT_PATH}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, INIT_CHECKPOINT_PATH)
+        except OSError as e:
+            logger.warning(f"Failed to save init checkpoint: {e}")
+
+
+def mark_channel_dirty(channel_id: str):
+    """A user is being let into the channel, so it needs cleaning next startup"""
+    if _CLEAN_CHANNELS.pop(channel_id, None) is not None:
+        save_init_checkpoint()
+
+
 def initialize_app():
     logger.info("Initializing Voyager...")
 
@@ -843,66 +1323,79 @@ def initialize_app():
         logger.error("Failed to set up lobby channel - exiting")
         sys.exit(1)
 
-    global INSTANCES, CURRENTLY_WAITING, ROUND_TIMERS
+    global INSTANCES, CURRENTLY_WAITING
 
-    for timer in ROUND_TIMERS.values():
-        if timer:
-            timer.cancel()
+    for channel_id in INSTANCES:
+        cancel_round_jobs(channel_id)
 
     INSTANCES = {}
-    CURRENTLY_WAITING = []
-    ROUND_TIMERS = {}
-
-    cursor = None
-    while True:
-        result = app.client.conversations_list(
+    CURRENTLY_WAITING = collections.OrderedDict()
+    with _FREE_LOCK:
+        _FREE_INSTANCES.clear()
+        _STATE_COUNTS.clear()
+    _CLEAN_CHANNELS.clear()
+
+    # channels nobody has been let into since they were last cleaned
+    already_done = load_init_checkpoint()
+
+    def list_channels(cursor: Optional[str]):
+        return slack_fetch(
+            app.client.conversations_list,
             types="private_channel",
-            limit=100,
+            limit=200,
             cursor=cursor,
         )
 
+    next_page = EXEC.submit(list_channels, None)
+    while next_page:
+        result = next_page.result()
+        cursor = result.get("response_metadata", {}).get("next_cursor")
+        # fetch the next page while this one's channels are being cleaned up
+        next_page = EXEC.submit(list_channels, cursor) if cursor else None
+
         for channel in result["channels"]:
             if not channel["is_member"] or not channel["name"].startswith("v-inst-"):
                 continue
 
-            logger.info(f"Cleaning up instance {channel['name']}")
-            members = app.client.conversations_members(channel=channel["id"])["members"]
-            for member in members:
-                if member not in [ADMIN_ID, BOT_ID]:
-                    try:
-                        app.client.conversations_kick(
-                            channel=channel["id"], user=member
-                        )
-                        # purge channel messages
-                        result = app.client.conversations_history(
-                            channel=channel["id"], limit=1000, inclusive=True
-                        )
-                        for message in result["messages"]:
-                            app.client.chat_delete(
-                                channel=channel["id"], ts=message["ts"]
-                            )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to kick user {member} from channel {channel['name']}: {e}"
-                        )
+            # only trust the checkpoint if nothing changed while we were down -
+            # membership is re-checked too, it's one call and catches manual joins
+            metadata = channel_metadata(channel)
+            if already_done.get(channel["id"]) == metadata and not (
+                get_channel_members(channel["id"]) - PROTECTED_USERS
+            ):
+                logger.info(f"Instance {channel['name']} already clean, skipping")
+                _CLEAN_CHANNELS[channel["id"]] = metadata
+            else:
+                logger.info(f"Cleaning up instance {channel['name']}")
+                # slack calls here are independent round-trips, so fan them out
+                if cleanup_instance_channel(EXEC, channel):
+                    # kicks change the metadata, so record it as it is now
+                    cleaned = fetch_channel_metadata(channel["id"])
+                    if cleaned is not None:
+                        _CLEAN_CHANNELS[channel["id"]] = cleaned
 
             # now add back to INSTANCES
             INSTANCES[channel["id"]] = create_instance_with_dialogue(
                 channel["id"], channel["name"]
             )
-        cursor = result.get("response_metadata", {}).get("next_cursor")
-        if not cursor:
-            break
+            with _FREE_LOCK:
+                _FREE_INSTANCES.append(channel["id"])
+
+    save_init_checkpoint()
 
     try:
-        result = app.client.conversations_history(channel=LOBBY_CHANNEL_ID, limit=1000)
-        for message in result["messages"]:
-            if message.get("user") == BOT_ID:
-                app.client.chat_delete(channel=LOBBY_CHANNEL_ID, ts=message["ts"])
+        # only look back over the purge window rather than the whole lobby
+        bot_messages = iter_history_ts(
+            LOBBY_CHANNEL_ID,
+            predicate=lambda message: message.get("user") == BOT_ID,
+            oldest=str(time.time() - LOBBY_PURGE_WINDOW),
+        )
+        delete_messages(EXEC, LOBBY_CHANNEL_ID, bot_messages, "lobby")
     except Exception as e:
         logger.error(f"Failed to purge previous messages: {e}")
 
-    app.client.chat_postMessage(
+    slack_call(
+        app.client.chat_postMessage,
         channel=LOBBY_CHANNEL_ID,
         text="Voyager is ready! Use the following commands:\n• `/waitlist` - Join the queue for a game\n• `/state` - Check current game status",
     )
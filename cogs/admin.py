@@ -1,13 +1,86 @@
+import asyncio
+import functools
 import logging
+import re
 import nextcord
 from nextcord.ext import commands
 from nextcord import Interaction
 
 from config import MAX_CHANNELS, ERROR_RESPONSE
+from cogs.events import (
+    AVAILABLE_CHANNEL_TOPIC,
+    allocate_game_channel,
+    delete_messages_chunked,
+    ensure_voyager_category,
+    find_or_create_lobby,
+    get_server_state,
+    send_initial_lobby_message,
+)
+from cogs.game import create_instance_with_dialogue
+
 # from discord import DISCORD_ADMIN_ID
 
 logger = logging.getLogger("voyager_discord")
 
+# bound once at import, these are hit on every admin command
+_SERVER_ONLY = ERROR_RESPONSE["server_only"]
+_ADMIN_REQUIRED = ERROR_RESPONSE["admin_required"]
+_MAX_CHANNELS_REACHED = ERROR_RESPONSE["max_channels_reached"]
+_FAILED_CREATE_CHANNEL = ERROR_RESPONSE["failed_create_channel"]
+_NO_AVAILABLE_CHANNELS = ERROR_RESPONSE["no_available_channels"]
+_NO_ACTIVE_GAME = ERROR_RESPONSE["no_active_game"]
+_ALREADY_IN_GAME = ERROR_RESPONSE["already_in_game"]
+_PURGING_LOBBY = ERROR_RESPONSE["purging_lobby"]
+_FAILED_PURGE_LOBBY = ERROR_RESPONSE["failed_purge_lobby"]
+
+# the constant parts (status, channel cap) are filled in once here
+_CHANNEL_CREATED = (
+    "Game channel created: {name}\n"
+    "Channel: <#{channel_id}>\n"
+    "Status: Available for games\n"
+    "Channels Total: {total}/" + str(MAX_CHANNELS)
+)
+
+DISCORD_MESSAGE_LIMIT = 2000
+# anything discord would reject or mangle in a text channel name
+_SLUG_RE = re.compile(r"[^a-z0-9-]+")
+
+
+def chunk_lines(lines, limit=DISCORD_MESSAGE_LIMIT):
+    """Join lines into as few messages as fit under Discord's length limit"""
+    chunks = []
+    current = []
+    size = 0
+    for line in lines:
+        line = line[:limit]
+        # +1 for the newline joining it to the previous line
+        if current and size + len(line) + 1 > limit:
+            chunks.append("\n".join(current))
+            current, size = [], 0
+        size += len(line) + (1 if current else 0)
+        current.append(line)
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def require_admin(func):
+    """Only let server administrators run the wrapped admin subcommand"""
+
+    @functools.wraps(func)
+    async def wrapper(self, interaction: Interaction, *args, **kwargs):
+        if not interaction.guild:
+            await interaction.response.send_message(_SERVER_ONLY, ephemeral=True)
+            return
+
+        if not interaction.user.guild_permissions.administrator:
+            await interaction.response.send_message(_ADMIN_REQUIRED, ephemeral=True)
+            return
+
+        return await func(self, interaction, *args, **kwargs)
+
+    return wrapper
+
 
 class AdminCog(commands.Cog):
     """Admin commands for managing games"""
@@ -24,22 +97,16 @@ class AdminCog(commands.Cog):
     @admin_group.subcommand(
         name="create", description="Create a new game channel (Admin only)"
     )
+    @require_admin
     async def admin_create_channel(self, interaction: Interaction, name: str):
         guild = interaction.guild
-        if not guild:
-            await interaction.response.send_message(
-                ERROR_RESPONSE["server_only"], ephemeral=True
-            )
-            return
-
-        from cogs.events import get_server_state, ensure_voyager_category
 
         server_state = get_server_state(guild.id)
 
         total_channels = len(server_state.all_game_channels)
         if total_channels >= MAX_CHANNELS:
             await interaction.response.send_message(
-                ERROR_RESPONSE["max_channels_reached"],
+                _MAX_CHANNELS_REACHED,
                 ephemeral=True,
             )
             return
@@ -47,7 +114,8 @@ class AdminCog(commands.Cog):
         # create new game channel
         try:
             category = await ensure_voyager_category(guild)
-            channel_name = f"v-inst-{name.lower().replace(' ', '-')}"
+            slug = _SLUG_RE.sub("-", name.lower()).strip("-")[:90]
+            channel_name = f"v-inst-{slug}"
             overwrites = {
                 guild.default_role: nextcord.PermissionOverwrite(
                     view_channel=False, send_messages=False
@@ -60,41 +128,30 @@ class AdminCog(commands.Cog):
             channel = await guild.create_text_channel(
                 channel_name,
                 category=category,
-                topic="Available game channel - waiting for assignment",
+                topic=AVAILABLE_CHANNEL_TOPIC,
                 reason=f"Admin-created game channel: {name}",
                 overwrites=overwrites,
             )
 
-            server_state.all_game_channels.append(channel.id)
-            server_state.available_game_channels.append(channel.id)
+            total = server_state.register_new_channel(channel.id)
 
             await interaction.response.send_message(
-                f"Game channel created: {name}\n"
-                f"Channel: <#{channel.id}>\n"
-                f"Status: Available for games\n"
-                f"Channels Total: {len(server_state.all_game_channels)}/{MAX_CHANNELS}"
+                _CHANNEL_CREATED.format(name=name, channel_id=channel.id, total=total)
             )
 
         except Exception as e:
             logger.error(f"Failed to create game channel in {guild.name}: {e}")
             await interaction.response.send_message(
-                ERROR_RESPONSE["failed_create_channel"],
+                _FAILED_CREATE_CHANNEL,
                 ephemeral=True,
             )
 
     @admin_group.subcommand(
         name="instance", description="Create a new game instance (Admin only)"
     )
+    @require_admin
     async def admin_create_instance(self, interaction: Interaction, name: str):
         guild = interaction.guild
-        if not guild:
-            await interaction.response.send_message(
-                ERROR_RESPONSE["server_only"], ephemeral=True
-            )
-            return
-
-        from cogs.events import get_server_state, allocate_game_channel
-        from cogs.game import create_instance_with_dialogue
 
         server_state = get_server_state(guild.id)
 
@@ -108,13 +165,13 @@ class AdminCog(commands.Cog):
         game_channel = await allocate_game_channel(guild, name)
         if not game_channel:
             await interaction.response.send_message(
-                ERROR_RESPONSE["no_available_channels"],
+                _NO_AVAILABLE_CHANNELS,
                 ephemeral=True,
             )
             return
 
         instance = create_instance_with_dialogue(guild.id, game_channel.id, name)
-        server_state.instances[game_channel.id] = instance
+        server_state.add_instance(game_channel.id, instance)
 
         await interaction.response.send_message(
             f"Game instance created: {name}\n"
@@ -125,54 +182,48 @@ class AdminCog(commands.Cog):
     @admin_group.subcommand(
         name="invite", description="Invite a user to the current game (Admin only)"
     )
+    @require_admin
     async def admin_invite_user(self, interaction: Interaction, user: nextcord.Member):
         guild = interaction.guild
-        if not guild:
-            await interaction.response.send_message(
-                ERROR_RESPONSE["server_only"], ephemeral=True
-            )
-            return
-
-        from cogs.events import get_server_state
 
         server_state = get_server_state(guild.id)
         channel_id = interaction.channel_id
 
         if channel_id not in server_state.instances:
-            await interaction.response.send_message(
-                ERROR_RESPONSE["no_active_game"], ephemeral=True
-            )
+            await interaction.response.send_message(_NO_ACTIVE_GAME, ephemeral=True)
             return
 
         instance = server_state.instances[channel_id]
 
-        if str(user.id) in instance.players:
+        if user.id in instance.players:
             await interaction.response.send_message(
-                ERROR_RESPONSE["already_in_game"].format(user_mention=user.mention),
+                _ALREADY_IN_GAME.format(user_mention=user.mention),
                 ephemeral=True,
             )
             return
 
-        instance.add_player(str(user.id))
+        instance.add_player(user.id)
 
-        try:
-            channel = guild.get_channel(channel_id)
-            if channel:
-                await channel.set_permissions(
-                    user, read_messages=True, send_messages=True
-                )
-        except Exception as e:
-            logger.error(f"Failed to set permissions for user {user.id}: {e}")
-
-        try:
-            channel = guild.get_channel(channel_id)
-            if channel:
-                await channel.send(
+        # the command runs inside the game channel, which the interaction carries
+        channel = interaction.channel
+        if channel:
+            # independent routes, so don't wait on one before starting the other
+            permissions_result, welcome_result = await asyncio.gather(
+                channel.set_permissions(user, read_messages=True, send_messages=True),
+                channel.send(
                     f"{user.mention} has been invited to the game!\n"
                     f"Total Players: {len(instance.players)}"
+                ),
+                return_exceptions=True,
+            )
+            if isinstance(permissions_result, Exception):
+                logger.error(
+                    f"Failed to set permissions for user {user.id}: {permissions_result}"
+                )
+            if isinstance(welcome_result, Exception):
+                logger.error(
+                    f"Failed to send welcome message for user {user.id}: {welcome_result}"
                 )
-        except Exception as e:
-            logger.error(f"Failed to send welcome message for user {user.id}: {e}")
 
         await interaction.response.send_message(
             f"{user.mention} has been invited to the game!\n"
@@ -183,24 +234,16 @@ class AdminCog(commands.Cog):
         name="purgelobby",
         description="Purge all messages from the lobby channel (Admin only)",
     )
+    @require_admin
     async def admin_purge_lobby(self, interaction: Interaction):
         guild = interaction.guild
-        if not guild:
-            await interaction.response.send_message(
-                ERROR_RESPONSE["server_only"], ephemeral=True
-            )
-            return
-
-        from cogs.events import find_or_create_lobby, send_initial_lobby_message
 
         # server_state = get_server_state(guild.id)
 
         try:
             lobby_channel = await find_or_create_lobby(guild)
 
-            await interaction.response.send_message(
-                ERROR_RESPONSE["purging_lobby"], ephemeral=True
-            )
+            await interaction.response.send_message(_PURGING_LOBBY, ephemeral=True)
 
             try:
                 await lobby_channel.purge(bulk=True)
@@ -209,13 +252,7 @@ class AdminCog(commands.Cog):
                 logger.warning(
                     f"Bulk delete failed in lobby, falling back to individual: {e}"
                 )
-                deleted_count = 0
-                async for message in lobby_channel.history(limit=None):
-                    try:
-                        await message.delete()
-                        deleted_count += 1
-                    except Exception as e:
-                        logger.debug(f"Failed to delete message in lobby: {e}")
+                deleted_count = await delete_messages_chunked(lobby_channel)
 
                 logger.info(
                     f"Admin purged {deleted_count} messages from lobby in {guild.name}"
@@ -231,7 +268,7 @@ class AdminCog(commands.Cog):
         except Exception as e:
             logger.error(f"Failed to purge lobby in {guild.name}: {e}")
             await interaction.followup.send(
-                ERROR_RESPONSE["failed_purge_lobby"],
+                _FAILED_PURGE_LOBBY,
                 ephemeral=True,
             )
 
@@ -239,15 +276,9 @@ class AdminCog(commands.Cog):
         name="purgeroles",
         description="Purge all game roles (Admin only)",
     )
+    @require_admin
     async def admin_purge_roles(self, interaction: Interaction):
         guild = interaction.guild
-        if not guild:
-            await interaction.response.send_message(
-                ERROR_RESPONSE["server_only"], ephemeral=True
-            )
-            return
-
-        from cogs.events import get_server_state
 
         server_state = get_server_state(guild.id)
 
@@ -261,31 +292,43 @@ class AdminCog(commands.Cog):
         # just straight up delete all game roles
         # all temp
         # I wish there was a tagging system for roles
-        for role in guild.roles:
-            if role.name.startswith("Voyaging "):
-                try:
-                    await role.delete(reason="Admin purge of game roles")
-                    deleted_roles.append(role.name)
-                    logger.info(f"Admin deleted game role: {role.name}")
-                except Exception as e:
-                    failed_roles.append(f"{role.name} (error: {e})")
-                    logger.error(f"Failed to delete role {role.name}: {e}")
+        # (scan guild.roles rather than game_roles so orphaned roles go too -
+        # it's the local cache, the deletes are what cost)
+        roles = [role for role in guild.roles if role.name.startswith("Voyaging ")]
+        semaphore = asyncio.Semaphore(5)  # stay inside discord's per-route bucket
+
+        async def delete_role(role: nextcord.Role):
+            async with semaphore:
+                await role.delete(reason="Admin purge of game roles")
+
+        results = await asyncio.gather(
+            *(delete_role(role) for role in roles), return_exceptions=True
+        )
+        for role, result in zip(roles, results):
+            if isinstance(result, Exception):
+                failed_roles.append(f"{role.name} (error: {result})")
+                logger.error(f"Failed to delete role {role.name}: {result}")
+            else:
+                deleted_roles.append(role.name)
+                logger.info(f"Admin deleted game role: {role.name}")
 
         server_state.game_roles.clear()
+        server_state.idle_game_roles.clear()
+        server_state.game_role_members.clear()
 
+        lines = []
         if deleted_roles:
-            response = f"**Successfully deleted {len(deleted_roles)} game roles:**\n"
-            for role_name in deleted_roles:
-                response += f"• {role_name}\n"
+            lines.append(f"**Successfully deleted {len(deleted_roles)} game roles:**")
+            lines.extend(f"• {role_name}" for role_name in deleted_roles)
         else:
-            response = "No game roles found to delete.\n"
+            lines.append("No game roles found to delete.")
 
         if failed_roles:
-            response += f"\n**Failed to delete {len(failed_roles)} roles:**\n"
-            for role_info in failed_roles:
-                response += f"• {role_info}\n"
+            lines.append(f"\n**Failed to delete {len(failed_roles)} roles:**")
+            lines.extend(f"• {role_info}" for role_info in failed_roles)
 
-        await interaction.followup.send(response, ephemeral=True)
+        for chunk in chunk_lines(lines):
+            await interaction.followup.send(chunk, ephemeral=True)
 
 
 def setup(bot):
@@ -2,6 +2,7 @@ import nextcord
 from nextcord.ext import commands
 from nextcord import Interaction
 from config import ERROR_RESPONSE
+from cogs.events import get_server_state
 
 
 class DebugCog(commands.Cog):
@@ -32,8 +33,6 @@ class DebugCog(commands.Cog):
             )
             return
 
-        from cogs.events import get_server_state
-
         server_state = get_server_state(guild.id)
 
         available_channels = [
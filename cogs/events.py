@@ -1,14 +1,18 @@
 import os
 import sys
 import asyncio
+import collections
+import contextlib
+import datetime
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 import nextcord
 from nextcord.ext import commands
 
 from instance import Instance, GameState
+from cogs.game import auto_evaluate_round, manage_answer_reactions
 from config import SERVER_DEFAULTS, ERROR_RESPONSE, ROLE_NAME_FRUITS
 import random
 import time
@@ -21,7 +25,7 @@ DEBUG = (
 logger = logging.getLogger("voyager_discord")
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerState:
     # basically just wrapped up state behind guild_id
     guild_id: int
@@ -30,10 +34,13 @@ class ServerState:
     waiting_users: List[int] = None
     instances: Dict[int, Instance] = None
     round_timers: Dict[int, asyncio.Task] = None
-    available_game_channels: List[int] = None  # pool of v-inst- channels for reuse
+    available_game_channels: Deque[int] = None  # pool of v-inst- channels for reuse
     used_game_channels: Dict[int, str] = None  # channel_id -> game_name mapping
     all_game_channels: List[int] = None  # total 10 channels
     game_roles: Dict[int, int] = None  # channel_id -> role_id mapping
+    game_role_members: Dict[int, Set[int]] = None  # role_id -> user ids we gave it
+    idle_game_roles: List[int] = None  # released game roles, parked for reuse
+    player_to_instance: Dict[int, tuple] = None  # user_id -> (channel_id, instance)
     pending_waitlist_interactions: Dict[int, "nextcord.Interaction"] = (
         None  # user_id -> interaction mapping
     )
@@ -42,6 +49,12 @@ class ServerState:
     ]  # whether the server has been automatically initialized
     max_channels: int = SERVER_DEFAULTS["max_channels"]
     config: Dict[str, any] = None  # server-specific
+    channel_ids_by_name: Dict[str, int] = None  # text channel name -> channel_id
+    category_ids_by_name: Dict[str, int] = None  # category name -> category_id
+    last_purged_message_id: Dict[int, int] = None  # channel_id -> last_message_id
+    _default_overwrites: Optional[tuple] = None  # ((everyone_id, me_id), overwrites)
+    game_channel_ids: Set[int] = None  # every v-inst- text channel
+    channels_indexed: bool = False  # whether the two above have been built yet
 
     def __post_init__(self):
         if self.waiting_users is None:
@@ -51,15 +64,29 @@ class ServerState:
         if self.round_timers is None:
             self.round_timers = {}
         if self.available_game_channels is None:
-            self.available_game_channels = []
+            self.available_game_channels = collections.deque()
         if self.used_game_channels is None:
             self.used_game_channels = {}
         if self.all_game_channels is None:
             self.all_game_channels = []
         if self.game_roles is None:
             self.game_roles = {}
+        if self.game_role_members is None:
+            self.game_role_members = {}
+        if self.idle_game_roles is None:
+            self.idle_game_roles = []
+        if self.player_to_instance is None:
+            self.player_to_instance = {}
         if self.pending_waitlist_interactions is None:
             self.pending_waitlist_interactions = {}
+        if self.channel_ids_by_name is None:
+            self.channel_ids_by_name = {}
+        if self.category_ids_by_name is None:
+            self.category_ids_by_name = {}
+        if self.last_purged_message_id is None:
+            self.last_purged_message_id = {}
+        if self.game_channel_ids is None:
+            self.game_channel_ids = set()
         if self.config is None:
             self.config = {
                 "hoist_roles": SERVER_DEFAULTS["hoist_roles"],
@@ -77,35 +104,132 @@ class ServerState:
                 "game_types_enabled": SERVER_DEFAULTS["game_types_enabled"],
             }
 
+    def index_channel(self, channel: nextcord.abc.GuildChannel):
+        if isinstance(channel, nextcord.CategoryChannel):
+            self.category_ids_by_name.setdefault(channel.name, channel.id)
+            return
+        if not isinstance(channel, nextcord.TextChannel):
+            return
+        self.channel_ids_by_name.setdefault(channel.name, channel.id)
+        if channel.name.startswith("v-inst-"):
+            self.game_channel_ids.add(channel.id)
+
+    def unindex_channel(self, channel: nextcord.abc.GuildChannel):
+        for by_name in (self.channel_ids_by_name, self.category_ids_by_name):
+            if by_name.get(channel.name) == channel.id:
+                del by_name[channel.name]
+        self.game_channel_ids.discard(channel.id)
+
+    def default_overwrites(self, guild: nextcord.Guild) -> Dict:
+        """Overwrites for an idle game channel - built once per guild"""
+        everyone_role, me = guild.default_role, guild.me
+        key = (everyone_role.id, me.id)
+        if self._default_overwrites is None or self._default_overwrites[0] != key:
+            overwrites = {
+                everyone_role: nextcord.PermissionOverwrite(
+                    view_channel=False, send_messages=False
+                ),
+                me: nextcord.PermissionOverwrite(
+                    view_channel=True, send_messages=True, read_message_history=True
+                ),
+            }
+            self._default_overwrites = (key, overwrites)
+        return self._default_overwrites[1]
+
+    def add_instance(self, channel_id: int, instance: Instance):
+        self.instances[channel_id] = instance
+        INSTANCE_CHANNELS.add(channel_id)
+
+        # players can join before the instance is registered, and after
+        entry = (channel_id, instance)
+        for user_id in instance.players:
+            self.player_to_instance[user_id] = entry
+        instance.set_player_listener(
+            lambda user_id, joined: self._track_player(entry, user_id, joined)
+        )
+
+    def remove_instance(self, channel_id: int) -> Optional[Instance]:
+        INSTANCE_CHANNELS.discard(channel_id)
+        instance = self.instances.pop(channel_id, None)
+        if instance:
+            self._untrack_instance(instance)
+        return instance
+
+    def clear_instances(self):
+        INSTANCE_CHANNELS.difference_update(self.instances)
+        for instance in self.instances.values():
+            self._untrack_instance(instance)
+        self.instances.clear()
+
+    def _track_player(self, entry: tuple, user_id: int, joined: bool):
+        if joined:
+            self.player_to_instance[user_id] = entry
+        elif self.player_to_instance.get(user_id) is entry:
+            del self.player_to_instance[user_id]
+
+    def _untrack_instance(self, instance: Instance):
+        instance.set_player_listener(None)
+        for user_id in instance.players:
+            entry = self.player_to_instance.get(user_id)
+            if entry and entry[1] is instance:
+                del self.player_to_instance[user_id]
+
+    def register_new_channel(self, channel_id: int) -> int:
+        """Add a freshly created game channel to the pool, returning the new total"""
+        # no await between the appends, so no other task sees one without the other
+        self.all_game_channels.append(channel_id)
+        self.available_game_channels.append(channel_id)
+        return len(self.all_game_channels)
+
 
 SERVERS: Dict[int, ServerState] = {}  # guild_id: ServerState
+# every channel on_message acts on, across all guilds, so the rest can be
+# dropped before touching any server state
+INSTANCE_CHANNELS: Set[int] = set()
+LOBBY_CHANNELS: Set[int] = set()
 
 
 def get_server_state(guild_id: int) -> ServerState:
     """Get or create server state"""
-    if guild_id not in SERVERS:
-        SERVERS[guild_id] = ServerState(
-            guild_id=guild_id, max_channels=SERVER_DEFAULTS["max_channels"]
+    # on every message, so one hash lookup in the common case
+    server_state = SERVERS.get(guild_id)
+    if server_state is None:
+        # setdefault so a racing creator can't replace a state already handed out
+        server_state = SERVERS.setdefault(
+            guild_id,
+            ServerState(
+                guild_id=guild_id, max_channels=SERVER_DEFAULTS["max_channels"]
+            ),
         )
+    return server_state
 
-    return SERVERS[guild_id]
+
+def get_indexed_server_state(guild: nextcord.Guild) -> ServerState:
+    """Get server state with its channel indexes built - one pass over the
+    guild's channels the first time, then kept fresh by EventsCog listeners"""
+    server_state = get_server_state(guild.id)
+    if not server_state.channels_indexed:
+        for channel in guild.channels:
+            server_state.index_channel(channel)
+        server_state.channels_indexed = True
+    return server_state
 
 
 async def ensure_voyager_category(guild: nextcord.Guild) -> nextcord.CategoryChannel:
     """Ensure Voyager Games category exists"""
-    server_state = get_server_state(guild.id)
+    server_state = get_indexed_server_state(guild)
 
+    category = None
     if server_state.category_id:
         category = guild.get_channel(server_state.category_id)
-        if category:
-            return category
-
-    category = nextcord.utils.get(guild.categories, name="Voyager")
+    if not category and "Voyager" in server_state.category_ids_by_name:
+        category = guild.get_channel(server_state.category_ids_by_name["Voyager"])
     if not category:
         category = await guild.create_category(
             "Voyager", reason="Auto-created for Voyager game instances"
         )
-        logger.debug(f"Created Voyager category in {guild.name}")
+        logger.debug("Created Voyager category in %s", guild.name)
+        server_state.index_channel(category)  # don't wait for the gateway event
 
     server_state.category_id = category.id
     return category
@@ -113,14 +237,13 @@ async def ensure_voyager_category(guild: nextcord.Guild) -> nextcord.CategoryCha
 
 async def find_or_create_lobby(guild: nextcord.Guild) -> nextcord.TextChannel:
     """Find or create lobby channel for the server"""
-    server_state = get_server_state(guild.id)
+    server_state = get_indexed_server_state(guild)
 
+    lobby = None
     if server_state.lobby_channel_id:
         lobby = guild.get_channel(server_state.lobby_channel_id)
-        if lobby:
-            return lobby
-
-    lobby = nextcord.utils.get(guild.text_channels, name="voyager-lobby")
+    if not lobby and "voyager-lobby" in server_state.channel_ids_by_name:
+        lobby = guild.get_channel(server_state.channel_ids_by_name["voyager-lobby"])
     if not lobby:
         category = await ensure_voyager_category(guild)
         lobby = await guild.create_text_channel(
@@ -129,58 +252,68 @@ async def find_or_create_lobby(guild: nextcord.Guild) -> nextcord.TextChannel:
             topic="Join games with /waitlist! Check status with /state",
             reason="Auto-created Voyager lobby channel",
         )
-        logger.debug(f"Created voyager-lobby channel in {guild.name}")
+        logger.debug("Created voyager-lobby channel in %s", guild.name)
+        server_state.index_channel(lobby)  # don't wait for the gateway event
 
     server_state.lobby_channel_id = lobby.id
+    LOBBY_CHANNELS.add(lobby.id)
     return lobby
 
 
+# only the two counts change between guilds, so build the card once and copy it
+_READY_EMBED = nextcord.Embed(
+    title="Voyaging", description="Voyager is ready!", color=nextcord.Color.green()
+)
+_READY_EMBED.add_field(name="Status", value="Ready!", inline=True)
+_READY_EMBED.add_field(name="Game Channels", value="-", inline=True)
+_READY_EMBED.add_field(name="Available", value="-", inline=True)
+
+_SETUP_REQUIRED = (
+    "Voyager is ready! Setup required.\n"
+    "Status: Manual setup required\n"
+    "Missing: {missing}\n"
+    "Setup:\n"
+    "• Use `/server create` to create game channels\n"
+    "• Server will auto-initialize when ready"
+)
+
+
+def ready_embed(
+    existing_count: int, available_count: int, max_channels: int
+) -> nextcord.Embed:
+    embed = _READY_EMBED.copy()
+    embed.set_field_at(
+        1, name="Game Channels", value=f"{existing_count}/{max_channels}", inline=True
+    )
+    embed.set_field_at(2, name="Available", value=f"{available_count}", inline=True)
+    return embed
+
+
+def setup_required_message(lobby_exists: bool) -> str:
+    return _SETUP_REQUIRED.format(
+        missing="Game channels" if lobby_exists else "Lobby channel"
+    )
+
+
 async def send_initial_lobby_message(
     guild: nextcord.Guild, lobby_channel: nextcord.TextChannel
 ):
-    server_state = get_server_state(guild.id)
+    server_state = get_indexed_server_state(guild)
 
-    lobby_exists = (
-        nextcord.utils.get(guild.text_channels, name="voyager-lobby") is not None
-    )
-    game_channels_exist = any(
-        channel.name.startswith("v-inst-") for channel in guild.text_channels
-    )
+    lobby_exists = "voyager-lobby" in server_state.channel_ids_by_name
+    game_channels_exist = bool(server_state.game_channel_ids)
 
     if lobby_exists and game_channels_exist and server_state.initialized:
         existing_channels = await discover_existing_game_channels(guild)
 
-        embed = nextcord.Embed(
-            title="Voyaging",
-            description="Voyager is ready!",
-            color=nextcord.Color.green(),
-        )
-        embed.add_field(
-            name="Status",
-            value="Ready!",
-            inline=True,
-        )
-        max_channels = server_state.config.get("max_channels", 10)
-        embed.add_field(
-            name="Game Channels",
-            value=f"{len(existing_channels)}/{max_channels}",
-            inline=True,
-        )
-        embed.add_field(
-            name="Available",
-            value=f"{len(server_state.available_game_channels)}",
-            inline=True,
+        embed = ready_embed(
+            len(existing_channels),
+            len(server_state.available_game_channels),
+            server_state.config.get("max_channels", 10),
         )
         await lobby_channel.send(embed=embed)
     else:
-        await lobby_channel.send(
-            f"Voyager is ready! Setup required.\n"
-            f"Status: Manual setup required\n"
-            f"Missing: {'Lobby channel' if not lobby_exists else 'Game channels'}\n"
-            f"Setup:\n"
-            f"• Use `/server create` to create game channels\n"
-            f"• Server will auto-initialize when ready"
-        )
+        await lobby_channel.send(setup_required_message(lobby_exists))
 
 
 async def discover_existing_game_channels(
@@ -188,94 +321,246 @@ async def discover_existing_game_channels(
 ) -> List[nextcord.TextChannel]:
     """Discover existing v-inst- channels in the server (limited to 10)"""
     game_channels = []
-    server_state = get_server_state(guild.id)
+    server_state = get_indexed_server_state(guild)
 
-    for channel in guild.text_channels:
-        if channel.name.startswith("v-inst-"):
+    for channel_id in server_state.game_channel_ids:
+        channel = guild.get_channel(channel_id)
+        if channel:
             game_channels.append(channel)
             logger.debug(
-                f"Found existing game channel: #{channel.name} in {guild.name}"
+                "Found existing game channel: #%s in %s", channel.name, guild.name
             )
 
     game_channels.sort(key=lambda c: c.created_at)
-    server_state = get_server_state(guild.id)
     max_channels = server_state.config.get("max_channels", 10)
     game_channels = game_channels[:max_channels]
 
     server_state.all_game_channels = [c.id for c in game_channels]
 
-    logger.debug(f"Limited to {len(game_channels)} game channels in {guild.name}")
+    logger.debug("Limited to %s game channels in %s", len(game_channels), guild.name)
 
     return game_channels
 
 
-async def purge_game_channel(channel: nextcord.TextChannel) -> bool:
-    """Purge all messages from a game channel to reset it"""
-    try:
-        # check if channel has any messages first
-        message_count = 0
+BULK_DELETE_MAX_AGE = datetime.timedelta(days=14)
+BULK_DELETE_MAX_COUNT = 100  # most messages one bulk delete call takes
+
+
+async def _delete_each(
+    messages: List[nextcord.Message], semaphore: asyncio.Semaphore
+) -> int:
+    async def delete(message: nextcord.Message) -> bool:
+        async with semaphore:
+            # already gone / no permission - counted and logged once by the caller
+            with contextlib.suppress(nextcord.HTTPException):
+                await message.delete()
+                return True
+            return False
+
+    return sum(await asyncio.gather(*(delete(m) for m in messages)))
+
+
+async def delete_messages_individually(
+    channel: nextcord.TextChannel,
+    batch_size: int = 50,
+    concurrency: int = 5,
+    before: Optional[nextcord.abc.Snowflake] = None,
+) -> int:
+    """Fallback for when bulk purge fails - deletes in concurrent batches"""
+    semaphore = asyncio.Semaphore(concurrency)  # discord's per-channel bucket
+
+    deleted_count = 0
+    attempted = 0
+    batch = []
+    async for message in channel.history(limit=None, before=before):
+        batch.append(message)
+        if len(batch) >= batch_size:
+            attempted += len(batch)
+            deleted_count += await _delete_each(batch, semaphore)
+            batch = []
+    if batch:
+        attempted += len(batch)
+        deleted_count += await _delete_each(batch, semaphore)
+
+    if deleted_count < attempted:
+        logger.debug(
+            "Failed to delete %s/%s messages in %s",
+            attempted - deleted_count,
+            attempted,
+            channel.name,
+        )
+    return deleted_count
+
+
+async def delete_messages_chunked(
+    channel: nextcord.TextChannel, concurrency: int = 5
+) -> int:
+    """Fallback for when purge fails - bulk deletes recent messages 100 at a
+    time, only deleting one by one what the bulk endpoint can't take"""
+    semaphore = asyncio.Semaphore(concurrency)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    oldest_bulk_id = nextcord.utils.time_snowflake(now - BULK_DELETE_MAX_AGE)
+
+    deleted_count = 0
+    attempted = 0
+
+    async def flush(batch: List[nextcord.Message]) -> int:
         try:
-            # get just one message to check if channel has content
+            await channel.delete_messages(batch)
+            return len(batch)
+        except nextcord.HTTPException as e:
+            logger.debug(
+                "Bulk delete of %s failed in %s: %s", len(batch), channel.name, e
+            )
+            return await _delete_each(batch, semaphore)
+
+    recent = []
+    old = []
+    async for message in channel.history(limit=None):
+        attempted += 1
+        if message.id < oldest_bulk_id:
+            old.append(message)
+            if len(old) >= BULK_DELETE_MAX_COUNT:
+                deleted_count += await _delete_each(old, semaphore)
+                old = []
+            continue
+        recent.append(message)
+        if len(recent) >= BULK_DELETE_MAX_COUNT:
+            deleted_count += await flush(recent)
+            recent = []
+    if recent:
+        deleted_count += await flush(recent)
+    if old:
+        deleted_count += await _delete_each(old, semaphore)
+
+    if deleted_count < attempted:
+        logger.debug(
+            "Failed to delete %s/%s messages in %s",
+            attempted - deleted_count,
+            attempted,
+            channel.name,
+        )
+    return deleted_count
+
+
+AVAILABLE_CHANNEL_TOPIC = "Available game channel - waiting for assignment"
+PURGE_LIMIT = 1000  # a game never gets near this, it just bounds the history walk
+
+
+async def _clear_game_channel_messages(
+    channel: nextcord.TextChannel, server_state: ServerState
+):
+    # nothing posted since the last purge means nothing to ask discord about
+    last_message_id = channel.last_message_id
+    already_purged = last_message_id is None or (
+        last_message_id == server_state.last_purged_message_id.get(channel.id)
+    )
+
+    # check if channel has any messages first
+    message_count = 0
+    checked = already_purged
+    try:
+        # get just one message to check if channel has content
+        if not already_purged:
             async for _ in channel.history(limit=1):
                 message_count = 1
                 break
-        # this caused bot hang initially :(
-        except Exception as e:
-            logger.debug(f"Failed to check messages in {channel.name}: {e}")
+            checked = True
+    # this caused bot hang initially :(
+    except Exception as e:
+        logger.debug("Failed to check messages in %s: %s", channel.name, e)
 
-        if message_count == 0:
-            logger.debug(f"Channel {channel.name} is already empty, skipping purge")
-        else:
-            # BULK DELETE
-            try:
-                await channel.purge(bulk=True)
-                logger.debug(f"Bulk deleted messages in {channel.name}")
-            except Exception as e:
-                logger.warning(
-                    f"Bulk delete failed in {channel.name}, falling back to individual: {e}"
-                )
-                # fallback (please not necessary)
-                async for message in channel.history(limit=None):
-                    try:
-                        await message.delete()
-                    except Exception as e:
-                        logger.debug(f"Failed to delete message in {channel.name}: {e}")
+    if message_count == 0:
+        logger.debug("Channel %s is already empty, skipping purge", channel.name)
+        if checked:
+            server_state.last_purged_message_id[channel.id] = last_message_id
+        return
 
-        # ATOMIC PERMISSION RESET TO PREVENT FLASH
-        # probably should explain for future me ^^ so if you update otherwise, it causes a "flash" of the channel
-        # where permissions briefly entirely disappear
-        try:
-            everyone_role = channel.guild.default_role
-            default_overwrites = {
-                everyone_role: nextcord.PermissionOverwrite(
-                    view_channel=False, send_messages=False
-                ),
-                channel.guild.me: nextcord.PermissionOverwrite(
-                    view_channel=True, send_messages=True, read_message_history=True
-                ),
-            }
+    # BULK DELETE
+    try:
+        # bulk delete only takes messages under 14 days old - bound the
+        # history walk to those, then sweep anything older separately
+        now = datetime.datetime.now(datetime.timezone.utc)
+        oldest = nextcord.utils.time_snowflake(now - BULK_DELETE_MAX_AGE)
+        cutoff = nextcord.Object(id=oldest)
+        # with after= the walk goes oldest first, so a full page means newer
+        # messages are still there - keep going until a short page comes back
+        while True:
+            deleted = await channel.purge(limit=PURGE_LIMIT, bulk=True, after=cutoff)
+            if len(deleted) < PURGE_LIMIT:
+                break
+        logger.debug("Bulk deleted messages in %s", channel.name)
+
+        async for _ in channel.history(limit=1, before=cutoff):
+            await delete_messages_individually(channel, before=cutoff)
+            break
+        server_state.last_purged_message_id[channel.id] = last_message_id
+    except Exception as e:
+        logger.warning(
+            f"Bulk delete failed in {channel.name}, falling back to individual: {e}"
+        )
+        # fallback (please not necessary)
+        await delete_messages_chunked(channel)
+
+
+async def _reset_game_channel(
+    channel: nextcord.TextChannel, server_state: ServerState
+) -> bool:
+    # ATOMIC PERMISSION RESET TO PREVENT FLASH
+    # probably should explain for future me ^^ so if you update otherwise, it causes a "flash" of the channel
+    # where permissions briefly entirely disappear
+    try:
+        default_overwrites = server_state.default_overwrites(channel.guild)
+        # the edit is a PATCH on a tight per-channel limit, skip it if already reset
+        if (
+            channel.topic == AVAILABLE_CHANNEL_TOPIC
+            and channel.overwrites == default_overwrites
+        ):
+            logger.debug("Permissions already reset for %s", channel.name)
+        else:
             await channel.edit(
-                topic="Available game channel - waiting for assignment",
+                topic=AVAILABLE_CHANNEL_TOPIC,
                 overwrites=default_overwrites,
             )
-            logger.debug(f"Reset permissions for {channel.name}")
-        except Exception as e:
-            logger.debug(f"Failed to reset permissions for {channel.name}: {e}")
-            try:
-                await channel.edit(
-                    topic="Available game channel - waiting for assignment"
-                )
-            except Exception as e2:
-                logger.debug(f"Failed to update topic for {channel.name}: {e2}")
-
-        logger.debug(f"Purged game channel #{channel.name}")
+            logger.debug("Reset permissions for %s", channel.name)
         return True
-
     except Exception as e:
-        logger.error(f"Failed to purge channel #{channel.name}: {e}")
+        logger.debug("Failed to reset permissions for %s: %s", channel.name, e)
+        try:
+            await channel.edit(topic=AVAILABLE_CHANNEL_TOPIC)
+        except Exception as e2:
+            logger.debug("Failed to update topic for %s: %s", channel.name, e2)
         return False
 
 
+async def _purge_game_channel(channel: nextcord.TextChannel) -> Tuple[bool, bool]:
+    """Purge a game channel - returns whether its messages were cleared and
+    whether its overwrites are back to the idle defaults"""
+    server_state = get_server_state(channel.guild.id)
+
+    # message deletes and the channel PATCH use separate rate limit buckets
+    clear_result, reset_result = await asyncio.gather(
+        _clear_game_channel_messages(channel, server_state),
+        _reset_game_channel(channel, server_state),
+        return_exceptions=True,
+    )
+    if isinstance(reset_result, Exception):
+        logger.debug("Failed to reset %s: %s", channel.name, reset_result)
+    reset = reset_result is True
+    if isinstance(clear_result, Exception):
+        logger.error(f"Failed to purge channel #{channel.name}: {clear_result}")
+        return False, reset
+
+    logger.debug("Purged game channel #%s", channel.name)
+    return True, reset
+
+
+async def purge_game_channel(channel: nextcord.TextChannel) -> bool:
+    """Purge all messages from a game channel to reset it"""
+    cleared, _ = await _purge_game_channel(channel)
+    return cleared
+
+
 async def allocate_game_channel(
     guild: nextcord.Guild, game_name: str
 ) -> Optional[nextcord.TextChannel]:
@@ -287,42 +572,47 @@ async def allocate_game_channel(
         return None
 
     if server_state.available_game_channels:
-        channel_id = server_state.available_game_channels.pop(0)
+        channel_id = server_state.available_game_channels.popleft()
         channel = guild.get_channel(channel_id)
 
         if channel:
             if await purge_game_channel(channel):
-                try:
-                    await channel.edit(
-                        topic=f"Game: {game_name} - Active game in progress",
-                    )
-                except Exception as e:
-                    logger.debug(f"Could not update channel topic: {e}")
-
-                server_state.used_game_channels[channel_id] = game_name
+                # game names repeat across allocations, so share one copy of each
+                server_state.used_game_channels[channel_id] = sys.intern(game_name)
 
+                topic = f"Game: {game_name} - Active game in progress"
                 role = await create_game_role(guild, channel_id, game_name)
                 if role:
+                    # topic and permissions go out in one PATCH - overwrites
+                    # replace the whole set, so start from the idle defaults
+                    overwrites = {
+                        **server_state.default_overwrites(guild),
+                        role: nextcord.PermissionOverwrite(
+                            read_messages=True, send_messages=True
+                        ),
+                    }
                     try:
-                        await channel.set_permissions(
-                            role, read_messages=True, send_messages=True
-                        )
-                        await channel.set_permissions(
-                            guild.default_role, read_messages=False, send_messages=False
-                        )
+                        await channel.edit(topic=topic, overwrites=overwrites)
                         logger.info(f"Set up channel permissions for role {role.name}")
                     except Exception as e:
                         logger.error(
                             f"Failed to set channel permissions for role {role.name}: {e}"
                         )
+                elif channel.topic != topic:
+                    try:
+                        await channel.edit(topic=topic)
+                    except Exception as e:
+                        logger.debug("Could not update channel topic: %s", e)
 
                 logger.debug(
-                    f"Allocated existing channel #{channel.name} for game {game_name}"
+                    "Allocated existing channel #%s for game %s",
+                    channel.name,
+                    game_name,
                 )
                 return channel
             else:
                 logger.debug(
-                    f"Failed to purge channel {channel_id}, removing from pool"
+                    "Failed to purge channel %s, removing from pool", channel_id
                 )
 
     logger.warning(
@@ -335,25 +625,80 @@ async def release_game_channel(guild: nextcord.Guild, channel_id: int) -> bool:
     """Release a game channel back to the available pool instead of deleting it"""
     server_state = get_server_state(guild.id)
 
-    if channel_id in server_state.used_game_channels:
-        del server_state.used_game_channels[channel_id]
+    server_state.used_game_channels.pop(channel_id, None)
 
     channel = guild.get_channel(channel_id)
     if not channel:
         return False
 
-    await cleanup_game_role(guild, channel_id)
+    cleared, reset = await _purge_game_channel(channel)
+    # the role's overwrite stays on the channel if the reset failed - parking
+    # it then would let its next game's players into this one
+    await cleanup_game_role(guild, channel_id, park=reset)
 
     # release to pool
-    if await purge_game_channel(channel):
+    if cleared:
         server_state.available_game_channels.append(channel_id)
-        logger.debug(f"Released game channel #{channel.name} back to pool")
+        logger.debug("Released game channel #%s back to pool", channel.name)
         return True
     else:
-        logger.debug(f"Failed to purge channel #{channel.name}, not returning to pool")
+        logger.debug("Failed to purge channel #%s, not returning to pool", channel.name)
         return False
 
 
+ROLE_COLORS = {
+    "blue": nextcord.Color.blue(),
+    "green": nextcord.Color.green(),
+    "red": nextcord.Color.red(),
+    "yellow": nextcord.Color.yellow(),
+    "purple": nextcord.Color.purple(),
+    "orange": nextcord.Color.orange(),
+    "pink": nextcord.Color.from_rgb(255, 105, 180),
+    "teal": nextcord.Color.teal(),
+    "default": nextcord.Color.default(),
+}
+
+
+async def take_idle_game_role(
+    guild: nextcord.Guild, **fields
+) -> Optional[nextcord.Role]:
+    """Rename a parked game role for a new game - one edit instead of a create"""
+    server_state = get_server_state(guild.id)
+
+    while server_state.idle_game_roles:
+        role = guild.get_role(server_state.idle_game_roles.pop())
+        if not role:
+            continue  # deleted while parked
+        try:
+            await role.edit(**fields)
+            return role
+        except Exception as e:
+            logger.warning(f"Failed to reuse game role {role.name}: {e}")
+    return None
+
+
+async def park_game_role(guild: nextcord.Guild, role: nextcord.Role) -> bool:
+    """Strip a finished game's players from its role and keep it for the next
+    game. Returns False if anyone couldn't be stripped - the caller deletes it"""
+    server_state = get_server_state(guild.id)
+
+    holders = server_state.game_role_members.pop(role.id, set())
+    members = [guild.get_member(user_id) for user_id in holders]
+    if not all(members):
+        # without the members intent we can't be sure who still holds it
+        return False
+
+    results = await asyncio.gather(
+        *(member.remove_roles(role, reason="Game ended") for member in members),
+        return_exceptions=True,
+    )
+    if any(isinstance(result, Exception) for result in results):
+        return False
+
+    server_state.idle_game_roles.append(role.id)
+    return True
+
+
 async def create_game_role(
     guild: nextcord.Guild, channel_id: int, game_name: str
 ) -> Optional[nextcord.Role]:
@@ -364,31 +709,30 @@ async def create_game_role(
         role_name = f"Voyaging {random_fruit}"
 
         color_name = server_state.config.get("role_color", "blue")
-        color_map = {
-            "blue": nextcord.Color.blue(),
-            "green": nextcord.Color.green(),
-            "red": nextcord.Color.red(),
-            "yellow": nextcord.Color.yellow(),
-            "purple": nextcord.Color.purple(),
-            "orange": nextcord.Color.orange(),
-            "pink": nextcord.Color.from_rgb(255, 105, 180),
-            "teal": nextcord.Color.teal(),
-            "default": nextcord.Color.default(),
-        }
-        role_color = color_map.get(color_name, nextcord.Color.blue())
+        role_color = ROLE_COLORS.get(color_name, ROLE_COLORS["blue"])
 
         hoist_roles = server_state.config.get("hoist_roles", True)
 
-        role = await guild.create_role(
+        role = await take_idle_game_role(
+            guild,
             name=role_name,
             color=role_color,
-            reason=f"Auto-created role for game: {game_name}",
-            mentionable=True,
             hoist=hoist_roles,
+            reason=f"Reused role for game: {game_name}",
         )
+        if role:
+            logger.info(f"Reused game role {role.name} for channel {channel_id}")
+        else:
+            role = await guild.create_role(
+                name=role_name,
+                color=role_color,
+                reason=f"Auto-created role for game: {game_name}",
+                mentionable=True,
+                hoist=hoist_roles,
+            )
+            logger.info(f"Created game role {role.name} for channel {channel_id}")
 
         server_state.game_roles[channel_id] = role.id
-        logger.info(f"Created game role {role.name} for channel {channel_id}")
 
         return role
 
@@ -411,21 +755,54 @@ async def get_or_create_game_role(
     return await create_game_role(guild, channel_id, game_name)
 
 
+# the most user ids one gateway member request takes
+QUERY_MEMBERS_MAX = 100
+
+
+async def assign_players_to_game_role(
+    guild: nextcord.Guild, user_ids: Iterable[int], channel_id: int, game_name: str
+) -> List[bool]:
+    """Give a whole roster the game role. Members missing from the cache are
+    pulled in with one gateway request rather than an HTTP fetch each"""
+    user_ids = [int(user_id) for user_id in user_ids]
+
+    missing = [user_id for user_id in user_ids if guild.get_member(user_id) is None]
+    for start in range(0, len(missing), QUERY_MEMBERS_MAX):
+        batch = missing[start : start + QUERY_MEMBERS_MAX]
+        try:
+            await guild.query_members(user_ids=batch, limit=len(batch))
+        except Exception as e:
+            # anyone still missing falls back to fetch_member below
+            logger.debug("Member query failed in %s: %s", guild.name, e)
+
+    # one at a time - the first call may create the role the rest reuse
+    return [
+        await _assign_member_game_role(guild, user_id, channel_id, game_name)
+        for user_id in user_ids
+    ]
+
+
 async def assign_player_to_game_role(
     guild: nextcord.Guild, user_id: int, channel_id: int, game_name: str
 ) -> bool:
-    try:
-        if isinstance(user_id, str):
-            user_id = int(user_id)
+    (success,) = await assign_players_to_game_role(
+        guild, [user_id], channel_id, game_name
+    )
+    return success
 
+
+async def _assign_member_game_role(
+    guild: nextcord.Guild, user_id: int, channel_id: int, game_name: str
+) -> bool:
+    try:
         user = guild.get_member(user_id)
         if not user:
             logger.debug(
-                f"User {user_id} not found in guild cache, trying Discord API..."
+                "User %s not found in guild cache, trying Discord API...", user_id
             )
             try:
                 user = await guild.fetch_member(user_id)
-                logger.debug(f"Successfully fetched user {user_id} from Discord API")
+                logger.debug("Successfully fetched user %s from Discord API", user_id)
             except Exception as fetch_error:
                 logger.error(
                     f"Failed to fetch user {user_id} from Discord API: {fetch_error}"
@@ -437,13 +814,16 @@ async def assign_player_to_game_role(
             logger.error(f"Failed to get/create game role for channel {channel_id}")
             return False
 
+        # remembered so the role can be stripped and reused when the game ends
+        holders = get_server_state(guild.id).game_role_members
+        holders.setdefault(role.id, set()).add(user_id)
         if role not in user.roles:
             await user.add_roles(role, reason=f"Player joined game: {game_name}")
             logger.debug(
-                f"Assigned role {role.name} to user {user_id} for game {game_name}"
+                "Assigned role %s to user %s for game %s", role.name, user_id, game_name
             )
         else:
-            logger.debug(f"User {user_id} already has role {role.name}")
+            logger.debug("User %s already has role %s", user_id, role.name)
 
         return True
 
@@ -459,24 +839,25 @@ async def remove_player_from_game_role(
         server_state = get_server_state(guild.id)
 
         if channel_id not in server_state.game_roles:
-            logger.debug(f"No game role found for channel {channel_id}")
+            logger.debug("No game role found for channel %s", channel_id)
             return True
 
         role_id = server_state.game_roles[channel_id]
         role = guild.get_role(role_id)
         if not role:
-            logger.debug(f"Game role {role_id} not found, removing from state")
+            logger.debug("Game role %s not found, removing from state", role_id)
             del server_state.game_roles[channel_id]
             return True
 
         user = guild.get_member(user_id)
         if not user:
-            logger.debug(f"User {user_id} not found in guild {guild.name}")
+            logger.debug("User %s not found in guild %s", user_id, guild.name)
             return True
 
         if role in user.roles:
             await user.remove_roles(role, reason="Player left game")
             logger.info(f"Removed role {role.name} from user {user_id}")
+        server_state.game_role_members.get(role_id, set()).discard(user_id)
         return True
 
     except Exception as e:
@@ -484,7 +865,9 @@ async def remove_player_from_game_role(
         return False
 
 
-async def cleanup_game_role(guild: nextcord.Guild, channel_id: int) -> bool:
+async def cleanup_game_role(
+    guild: nextcord.Guild, channel_id: int, park: bool = True
+) -> bool:
     try:
         server_state = get_server_state(guild.id)
 
@@ -495,8 +878,16 @@ async def cleanup_game_role(guild: nextcord.Guild, channel_id: int) -> bool:
         role = guild.get_role(role_id)
 
         if role:
-            await role.delete(reason="Game ended, cleaning up role")
-            logger.debug(f"Deleted game role {role.name} for channel {channel_id}")
+            if park and await park_game_role(guild, role):
+                logger.debug("Parked game role %s for reuse", role.name)
+            else:
+                server_state.game_role_members.pop(role_id, None)
+                await role.delete(reason="Game ended, cleaning up role")
+                logger.debug(
+                    "Deleted game role %s for channel %s", role.name, channel_id
+                )
+        else:
+            server_state.game_role_members.pop(role_id, None)
 
         del server_state.game_roles[channel_id]
         return True
@@ -506,125 +897,202 @@ async def cleanup_game_role(guild: nextcord.Guild, channel_id: int) -> bool:
         return False
 
 
-async def initialize_app(bot):
-    logger.debug("Initializing Discord bot...")
-
-    async def process_guild(guild):
-        logger.debug(f"Processing server: {guild.name} ({guild.id})")
+REQUIRED_PERMISSIONS = (
+    "send_messages",
+    "read_messages",
+    "manage_channels",
+    "manage_messages",
+    "embed_links",
+    "manage_roles",
+)
+_REQUIRED_PERMISSION_BITS = tuple(
+    (perm, nextcord.Permissions(**{perm: True}).value) for perm in REQUIRED_PERMISSIONS
+)
+REQUIRED_PERMISSIONS_MASK = 0
+for _, _bit in _REQUIRED_PERMISSION_BITS:
+    REQUIRED_PERMISSIONS_MASK |= _bit
+# only the heading and the missing list change between guilds
+_PERMISSION_WARNING = (
+    "⚠️ {heading}\n"
+    "Missing Permissions: {missing}\n"
+    "Required Permissions:\n"
+    + "".join(f"• {perm.replace('_', ' ').title()}\n" for perm in REQUIRED_PERMISSIONS)
+    + "Next Steps: Grant the missing permissions and restart the bot"
+)
 
-        try:
-            bot_member = guild.get_member(bot.user.id)
-            if not bot_member:
-                logger.error(f"Could not get bot member in {guild.name}")
-                return
-
-            required_permissions = [
-                "send_messages",
-                "read_messages",
-                "manage_channels",
-                "manage_messages",
-                "embed_links",
-                "manage_roles",
-            ]
+# startup fans out over every guild and every game channel in it - cap how many
+# run at once so the bursts stay inside discord's rate limits instead of stalling
+_GUILD_SLOTS = asyncio.Semaphore(8)
+PURGES_PER_GUILD = 4
 
-            missing_permissions = []
-            for perm in required_permissions:
-                if not getattr(bot_member.guild_permissions, perm, False):
-                    missing_permissions.append(perm)
 
-            if missing_permissions:
+async def send_permission_warning(
+    guild: nextcord.Guild,
+    bot_member: nextcord.Member,
+    missing_permissions: List[str],
+    heading: str,
+) -> bool:
+    """Post the missing permissions warning in the first channel that takes it"""
+    for channel in guild.text_channels:
+        if channel.permissions_for(bot_member).send_messages:
+            try:
+                await channel.send(
+                    _PERMISSION_WARNING.format(
+                        heading=heading, missing=", ".join(missing_permissions)
+                    )
+                )
+                logger.debug("Sent permission warning to %s", guild.name)
+                return True
+            except Exception as e:
                 logger.debug(
-                    f"Bot missing permissions in {guild.name}: {missing_permissions}"
+                    "Failed to send permission warning in %s: %s", guild.name, e
                 )
-                for channel in guild.text_channels:
-                    if channel.permissions_for(bot_member).send_messages:
-                        try:
-                            await channel.send(
-                                f"⚠️ I need some permissions to work properly\n"
-                                f"Missing Permissions: {', '.join(missing_permissions)}\n"
-                                f"Required Permissions:\n"
-                                f"• Send Messages\n"
-                                f"• Read Messages\n"
-                                f"• Manage Channels\n"
-                                f"• Manage Messages\n"
-                                f"• Embed Links\n"
-                                f"• Manage Roles\n"
-                                f"Next Steps: Grant the missing permissions and restart the bot"
-                            )
-                            logger.debug(f"Sent permission warning to {guild.name}")
-                            break
-                        except Exception as e:
-                            logger.debug(
-                                f"Failed to send permission warning in {guild.name}: {e}"
-                            )
-                            continue
-                return
+    return False
 
-            server_state = get_server_state(guild.id)
 
-            lobby_exists = (
-                nextcord.utils.get(guild.text_channels, name="voyager-lobby")
-                is not None
-            )
+async def bootstrap_guild(
+    bot, guild: nextcord.Guild, joined_now: bool = False, announce: bool = True
+) -> Optional[nextcord.TextChannel]:
+    """Check permissions, reclaim existing game channels and greet the lobby.
+    Shared by startup (every guild) and on_guild_join (the new one).
+    Returns the lobby once set up - with announce=False the greeting is left
+    to the caller."""
+    logger.debug("Processing server: %s (%s)", guild.name, guild.id)
 
-            game_channels_exist = any(
-                channel.name.startswith("v-inst-") for channel in guild.text_channels
+    try:
+        bot_member = guild.get_member(bot.user.id)
+        if not bot_member:
+            logger.error(f"Could not get bot member in {guild.name}")
+            return
+
+        missing_bits = REQUIRED_PERMISSIONS_MASK & ~bot_member.guild_permissions.value
+        if missing_bits:
+            # names are only needed for the warning
+            missing_permissions = [
+                perm for perm, bit in _REQUIRED_PERMISSION_BITS if bit & missing_bits
+            ]
+            logger.debug(
+                "Bot missing permissions in %s: %s", guild.name, missing_permissions
             )
+            heading = (
+                "Bot is missing required permissions"
+                if joined_now
+                else "I need some permissions to work properly"
+            )
+            sent = await send_permission_warning(
+                guild, bot_member, missing_permissions, heading
+            )
+            if not sent and joined_now:
+                logger.error(
+                    f"Could not send permission warning in {guild.name} - no accessible channels"
+                )
+            return
 
-            if lobby_exists and game_channels_exist:
-                logger.debug(f"Starting server {guild.name}")
+        server_state = get_indexed_server_state(guild)
 
-                lobby_channel = await find_or_create_lobby(guild)
+        lobby_exists = "voyager-lobby" in server_state.channel_ids_by_name
+        game_channels_exist = bool(server_state.game_channel_ids)
 
-                existing_channels = await discover_existing_game_channels(guild)
+        lobby_channel = await find_or_create_lobby(guild)
 
-                purge_tasks = []
-                for channel in existing_channels:
-                    purge_tasks.append(purge_game_channel(channel))
+        if lobby_exists and game_channels_exist:
+            logger.debug("Starting server %s", guild.name)
 
-                try:
-                    purge_results = await asyncio.wait_for(
-                        asyncio.gather(*purge_tasks, return_exceptions=True),
-                        timeout=30.0,
-                    )
-                except asyncio.TimeoutError:
+            existing_channels = await discover_existing_game_channels(guild)
+
+            # per guild, so one guild's purges never queue behind another's and
+            # eat into its own timeout
+            purge_slots = asyncio.Semaphore(PURGES_PER_GUILD)
+
+            async def purge_gated(channel: nextcord.TextChannel) -> bool:
+                async with purge_slots:
+                    return await purge_game_channel(channel)
+
+            purge_tasks = []
+            for channel in existing_channels:
+                purge_tasks.append(purge_gated(channel))
+
+            try:
+                purge_results = await asyncio.wait_for(
+                    asyncio.gather(*purge_tasks, return_exceptions=True),
+                    timeout=30.0,
+                )
+            except asyncio.TimeoutError:
+                logger.error(
+                    f"Purge operations timed out for {guild.name}, skipping channel purging"
+                )
+                purge_results = [Exception("Timeout") for _ in purge_tasks]
+
+            for i, result in enumerate(purge_results):
+                if isinstance(result, Exception):
                     logger.error(
-                        f"Purge operations timed out for {guild.name}, skipping channel purging"
+                        f"Failed to purge channel {existing_channels[i].name}: {result}"
+                    )
+                elif result:
+                    server_state.available_game_channels.append(existing_channels[i].id)
+                    logger.debug(
+                        "Added existing channel #%s to available pool",
+                        existing_channels[i].name,
                     )
-                    purge_results = [Exception("Timeout") for _ in purge_tasks]
 
-                for i, result in enumerate(purge_results):
-                    if isinstance(result, Exception):
-                        logger.error(
-                            f"Failed to purge channel {existing_channels[i].name}: {result}"
-                        )
-                    elif result:
-                        server_state.available_game_channels.append(
-                            existing_channels[i].id
-                        )
-                        logger.debug(
-                            f"Added existing channel #{existing_channels[i].name} to available pool"
-                        )
+            server_state.initialized = True
 
-                server_state.initialized = True
+        if announce:
+            await send_initial_lobby_message(guild, lobby_channel)
 
-                await send_initial_lobby_message(guild, lobby_channel)
-            else:
-                lobby_channel = await find_or_create_lobby(guild)
+        logger.debug("Processed server %s", guild.name)
+        return lobby_channel
 
-                await send_initial_lobby_message(guild, lobby_channel)
+    except Exception as e:
+        logger.warning(f"Failed to process server {guild.name}: {e}")
+        return None
 
-            logger.debug(f"Processed server {guild.name}")
 
-        except Exception as e:
-            logger.warning(f"Failed to process server {guild.name}: {e}")
+async def initialize_app(bot):
+    logger.debug("Initializing Discord bot...")
 
-    guild_tasks = [process_guild(guild) for guild in bot.guilds]
-    await asyncio.gather(*guild_tasks, return_exceptions=True)  # gather, my beloved
+    async def bootstrap_gated(guild: nextcord.Guild):
+        async with _GUILD_SLOTS:
+            return await bootstrap_guild(bot, guild, announce=False)
+
+    # greet every lobby together at the end so a guild's slot frees up as soon
+    # as its own setup is done rather than after its lobby send
+    guilds = list(bot.guilds)
+    guild_tasks = [bootstrap_gated(guild) for guild in guilds]
+    # gather, my beloved
+    lobbies = await asyncio.gather(*guild_tasks, return_exceptions=True)
+
+    announcements = [
+        send_initial_lobby_message(guild, lobby)
+        for guild, lobby in zip(guilds, lobbies)
+        if lobby and not isinstance(lobby, Exception)
+    ]
+    results = await asyncio.gather(*announcements, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to send lobby greeting: {result}")
 
     logger.info("Discord bot initialization complete")
 
 
+async def cancel_round_timers(server_states: Iterable[ServerState]):
+    """Cancel every pending round timer at once, then wait for them all to finish"""
+    server_states = list(server_states)
+    timers = [
+        timer
+        for server_state in server_states
+        for timer in server_state.round_timers.values()
+        if timer and not timer.done()
+    ]
+    for timer in timers:
+        timer.cancel()
+    await asyncio.gather(*timers, return_exceptions=True)
+    logger.debug("Cancelled %s round timers", len(timers))
+
+    for server_state in server_states:
+        server_state.round_timers.clear()
+
+
 class EventsCog(commands.Cog):
     """Event handlers for the bot"""
 
@@ -633,47 +1101,57 @@ class EventsCog(commands.Cog):
 
     async def cleanup(self):
         """Clean up running timers and tasks"""
+        await cancel_round_timers(SERVERS.values())
+
         for guild_id, server_state in SERVERS.items():
             guild = self.bot.get_guild(guild_id)
 
-            for timer in server_state.round_timers.values():
-                if timer and not timer.done():
-                    timer.cancel()
-                    logger.debug(f"Cancelled round timer for guild {guild_id}")
-            server_state.round_timers.clear()
-
-            numroles = len(server_state.game_roles)
+            role_ids = [
+                *server_state.game_roles.values(),
+                *server_state.idle_game_roles,
+            ]
+            numroles = len(role_ids)
             if guild:
-                for role_id in server_state.game_roles.copy().values():
-                    try:
-                        role = guild.get_role(role_id)
-                        if role:
-                            await role.delete(reason="Bot shutdown cleanup")
-                            logger.debug(
-                                f"Deleted game role {role.name} during shutdown cleanup"
-                            )
-                    except Exception as e:
+                roles = [role for role in map(guild.get_role, role_ids) if role]
+                deletes = [role.delete(reason="Bot shutdown cleanup") for role in roles]
+                try:
+                    results = await asyncio.wait_for(
+                        asyncio.gather(*deletes, return_exceptions=True), timeout=30.0
+                    )
+                except asyncio.TimeoutError:
+                    logger.error(f"Role cleanup timed out for guild {guild_id}")
+                    results = [Exception("Timeout") for _ in roles]
+
+                for role, result in zip(roles, results):
+                    if isinstance(result, Exception):
                         logger.error(
-                            f"Failed to delete role {role_id} during shutdown: {e}"
+                            f"Failed to delete role {role.id} during shutdown: {result}"
+                        )
+                    else:
+                        logger.debug(
+                            "Deleted game role %s during shutdown cleanup", role.name
                         )
                 server_state.game_roles.clear()
+                server_state.idle_game_roles.clear()
+                server_state.game_role_members.clear()
             logger.info(f"Cleaned up {numroles} game roles for guild {guild_id}")
 
             numinstances = len(server_state.instances)
             if guild:
-                for channel_id in server_state.instances.copy().keys():
+                for channel_id in list(server_state.instances):
                     try:
                         channel = guild.get_channel(channel_id)
                         if channel:
                             await purge_game_channel(channel)
                             logger.debug(
-                                f"Purged game channel {channel.name} during shutdown cleanup"
+                                "Purged game channel %s during shutdown cleanup",
+                                channel.name,
                             )
                     except Exception as e:
                         logger.error(
                             f"Failed to purge channel {channel_id} during shutdown: {e}"
                         )
-                server_state.instances.clear()
+                server_state.clear_instances()
             logger.info(
                 f"Cleaned up {numinstances} game instances for guild {guild_id}"
             )
@@ -681,7 +1159,7 @@ class EventsCog(commands.Cog):
     @commands.Cog.listener()
     async def on_ready(self):
         logger.info(f"Discord bot logged in as {self.bot.user}")
-        logger.debug(f"Bot is in {len(self.bot.guilds)} servers")
+        logger.debug("Bot is in %s servers", len(self.bot.guilds))
         from cogs.tasks import set_bot, start_process_waitlist_task
 
         set_bot(self.bot)
@@ -692,158 +1170,66 @@ class EventsCog(commands.Cog):
     @commands.Cog.listener()
     async def on_guild_join(self, guild):
         """Handle bot joining a new server"""
-        logger.debug(f"Joined new server: {guild.name} ({guild.id})")
-
-        try:
-            bot_member = guild.get_member(self.bot.user.id)
-            if not bot_member:
-                logger.error(f"Could not get bot member in {guild.name}")
-                return
-
-            required_permissions = [
-                "send_messages",
-                "read_messages",
-                "manage_channels",
-                "manage_messages",
-                "embed_links",
-                "manage_roles",
-            ]
-
-            missing_permissions = []
-            for perm in required_permissions:
-                if not getattr(bot_member.guild_permissions, perm, False):
-                    missing_permissions.append(perm)
-
-            if missing_permissions:
-                logger.debug(
-                    f"Bot missing permissions in {guild.name}: {missing_permissions}"
-                )
-                for channel in guild.text_channels:
-                    if channel.permissions_for(bot_member).send_messages:
-                        try:
-                            await channel.send(
-                                f"⚠️ Bot is missing required permissions\n"
-                                f"Missing Permissions: {', '.join(missing_permissions)}\n"
-                                f"Required Permissions:\n"
-                                f"• Send Messages\n"
-                                f"• Read Messages\n"
-                                f"• Manage Channels\n"
-                                f"• Manage Messages\n"
-                                f"• Embed Links\n"
-                                f"• Manage Roles\n"
-                                f"Next Steps: Grant the missing permissions and restart the bot"
-                            )
-                            logger.debug(f"Sent permission warning to {guild.name}")
-                            return
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to send permission warning in {guild.name}: {e}"
-                            )
-                            continue
-
-                logger.error(
-                    f"Could not send permission warning in {guild.name} - no accessible channels"
-                )
-                return
-
-            server_state = get_server_state(guild.id)
-
-            lobby_exists = (
-                nextcord.utils.get(guild.text_channels, name="voyager-lobby")
-                is not None
-            )
-
-            game_channels_exist = any(
-                channel.name.startswith("v-inst-") for channel in guild.text_channels
-            )
-
-            if lobby_exists and game_channels_exist:
-                logger.debug(f"Starting server {guild.name}")
-
-                lobby_channel = await find_or_create_lobby(guild)
-
-                existing_channels = await discover_existing_game_channels(guild)
-
-                purge_tasks = []
-                for channel in existing_channels:
-                    purge_tasks.append(purge_game_channel(channel))
-
-                try:
-                    purge_results = await asyncio.wait_for(
-                        asyncio.gather(*purge_tasks, return_exceptions=True),
-                        timeout=30.0,
-                    )
-                except asyncio.TimeoutError:
-                    logger.error(
-                        f"Purge operations timed out for {guild.name}, skipping channel purging"
-                    )
-                    purge_results = [Exception("Timeout") for _ in purge_tasks]
-
-                for i, result in enumerate(purge_results):
-                    if isinstance(result, Exception):
-                        logger.error(
-                            f"Failed to purge channel {existing_channels[i].name}: {result}"
-                        )
-                    elif result:
-                        server_state.available_game_channels.append(
-                            existing_channels[i].id
-                        )
-                        logger.debug(
-                            f"Added existing channel #{existing_channels[i].name} to available pool"
-                        )
+        logger.debug("Joined new server: %s (%s)", guild.name, guild.id)
+        await bootstrap_guild(self.bot, guild, joined_now=True)
 
-                server_state.initialized = True
-
-                await send_initial_lobby_message(guild, lobby_channel)
-            else:
-                lobby_channel = await find_or_create_lobby(guild)
-
-                await send_initial_lobby_message(guild, lobby_channel)
+    # keep the per-guild channel indexes in step with discord
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: nextcord.abc.GuildChannel):
+        server_state = SERVERS.get(channel.guild.id)
+        if server_state and server_state.channels_indexed:
+            server_state.index_channel(channel)
 
-            logger.debug(f"Bot joined server {guild.name}")
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: nextcord.abc.GuildChannel):
+        server_state = SERVERS.get(channel.guild.id)
+        if server_state and server_state.channels_indexed:
+            server_state.unindex_channel(channel)
 
-        except Exception as e:
-            logger.warning(f"Failed to process new server {guild.name}: {e}")
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self, before: nextcord.abc.GuildChannel, after: nextcord.abc.GuildChannel
+    ):
+        server_state = SERVERS.get(after.guild.id)
+        if server_state and server_state.channels_indexed and before.name != after.name:
+            server_state.unindex_channel(before)
+            server_state.index_channel(after)
 
     @commands.Cog.listener()
     async def on_guild_remove(self, guild):
         """Handle bot leaving a server"""
-        logger.debug(f"Left server: {guild.name} ({guild.id})")
+        logger.debug("Left server: %s (%s)", guild.name, guild.id)
 
         if guild.id in SERVERS:
             server_state = SERVERS[guild.id]
 
-            for timer in server_state.round_timers.values():
-                if timer:
-                    timer.cancel()
+            await cancel_round_timers([server_state])
 
+            server_state.clear_instances()
+            LOBBY_CHANNELS.discard(server_state.lobby_channel_id)
             del SERVERS[guild.id]
-            logger.debug(f"Cleaned up state for server {guild.name}")
+            logger.debug("Cleaned up state for server %s", guild.name)
 
     @commands.Cog.listener()
     async def on_message(self, message: nextcord.Message):
         if not message or message.author.bot or not message.guild:
             return
 
-        server_state = get_server_state(message.guild.id)
         channel_id = message.channel.id
+        if channel_id not in INSTANCE_CHANNELS and channel_id not in LOBBY_CHANNELS:
+            return
+
+        server_state = get_server_state(message.guild.id)
         user_id = message.author.id
 
         if channel_id == server_state.lobby_channel_id and message.mentions:
             try:
                 await message.delete()
-                logger.debug(f"Deleted @mention invite in lobby from user {user_id}")
-
-                user_game_channel = None
-                user_game_instance = None
-
-                for game_channel_id, instance in server_state.instances.items():
-                    if str(user_id) in instance.players:
-                        user_game_channel = game_channel_id
-                        user_game_instance = instance
-                        break
+                logger.debug("Deleted @mention invite in lobby from user %s", user_id)
 
-                if user_game_channel and user_game_instance:
+                entry = server_state.player_to_instance.get(user_id)
+                if entry:
+                    user_game_channel, user_game_instance = entry
                     # invite all mentioned users to the sender's current game
                     game_channel = message.guild.get_channel(user_game_channel)
                     if game_channel:
@@ -851,19 +1237,9 @@ class EventsCog(commands.Cog):
                             if mentioned_user.bot:
                                 continue
 
-                            # check if mentioned user is already in any game
-                            already_in_game = False
-                            for other_instance in server_state.instances.values():
-                                if str(mentioned_user.id) in other_instance.players:
-                                    already_in_game = True
-                                    break
-
-                            if (
-                                not already_in_game
-                                and str(mentioned_user.id)
-                                not in user_game_instance.players
-                            ):
-                                user_game_instance.add_player(str(mentioned_user.id))
+                            # anyone already in a game - this one included - is skipped
+                            if mentioned_user.id not in server_state.player_to_instance:
+                                user_game_instance.add_player(mentioned_user.id)
 
                                 success = await assign_player_to_game_role(
                                     message.guild,
@@ -873,7 +1249,8 @@ class EventsCog(commands.Cog):
                                 )
                                 if success:
                                     logger.debug(
-                                        f"Successfully assigned role to mentioned user {mentioned_user.id}"
+                                        "Successfully assigned role to mentioned user %s",
+                                        mentioned_user.id,
                                     )
 
                                     await game_channel.send(
@@ -890,31 +1267,31 @@ class EventsCog(commands.Cog):
         if channel_id in server_state.instances:
             instance = server_state.instances[channel_id]
             if instance.state == GameState.WAITING:
-                logger.debug(message.content, message.mentions, instance.players)
+                logger.debug(
+                    "%s %s %s", message.content, message.mentions, instance.players
+                )
                 # check for mentions
                 for mention in message.mentions:
                     if mention.id not in instance.players:
-                        await instance.add_player(mention.id)
+                        instance.add_player(mention.id)
                         await message.channel.send(f"{mention.mention} has been added!")
 
             if instance.current_challenge and instance.state == GameState.IN_PROGRESS:
-                from cogs.game import manage_answer_reactions
-
                 previous_ts = instance.submit_answer(
-                    str(user_id), message.content, message.id
+                    user_id, message.content, message.id
                 )
 
-                player = instance.players.get(str(user_id))
+                player = instance.players.get(user_id)
                 if player and instance.round_start_time:
                     response_time = time.time() - instance.round_start_time
 
                     await manage_answer_reactions(message, previous_ts, response_time)
 
-                    if instance.all_players_answered():
+                    # a timer-driven evaluation may already be scoring this round
+                    if instance.all_players_answered() and not instance.evaluating:
                         if channel_id in server_state.round_timers:
                             server_state.round_timers[channel_id].cancel()
                             del server_state.round_timers[channel_id]
-                            from cogs.game import auto_evaluate_round
                         await auto_evaluate_round(
                             message.guild.id, channel_id, message.guild.me._state.client
                         )
@@ -1,4 +1,5 @@
 import asyncio
+import collections
 import logging
 from typing import Optional
 
@@ -86,8 +87,8 @@ class GameControlView(nextcord.ui.View):
             )
             return
 
-        if str(interaction.user.id) not in instance.players:
-            instance.add_player(str(interaction.user.id))
+        if interaction.user.id not in instance.players:
+            instance.add_player(interaction.user.id)
             try:
                 from cogs.events import assign_player_to_game_role
 
@@ -130,7 +131,7 @@ class GameControlView(nextcord.ui.View):
                 await send_host_message(
                     self.channel_id, "main_round", interaction.client
                 )
-                challenge = instance.start_main_round()
+                challenge = await asyncio.to_thread(instance.start_main_round)
                 round_embed = create_round_embed(instance, challenge)
                 await interaction.channel.send(embed=round_embed)
                 schedule_round_evaluation(
@@ -216,7 +217,7 @@ class GameControlView(nextcord.ui.View):
                 instance = server_state.instances[self.channel_id]
 
                 # check if user is already in CURRENT instance
-                if str(user.id) in instance.players:
+                if user.id in instance.players:
                     await interaction.response.send_message(
                         ERROR_RESPONSE["already_in_game"].format(
                             user_mention=user.mention
@@ -229,7 +230,7 @@ class GameControlView(nextcord.ui.View):
                 for other_channel_id, other_instance in server_state.instances.items():
                     if (
                         other_channel_id != self.channel_id
-                        and str(user.id) in other_instance.players
+                        and user.id in other_instance.players
                     ):
                         await interaction.response.send_message(
                             f"{user.mention} is already in another game: {other_instance.name} in <#{other_channel_id}>\n"
@@ -238,7 +239,7 @@ class GameControlView(nextcord.ui.View):
                         )
                         return
 
-                instance.add_player(str(user.id))
+                instance.add_player(user.id)
 
                 try:
                     from cogs.events import assign_player_to_game_role
@@ -276,7 +277,7 @@ class GameControlView(nextcord.ui.View):
             )
             return
 
-        del server_state.instances[self.channel_id]
+        server_state.remove_instance(self.channel_id)
         guild = interaction.guild
         if guild:
             await release_game_channel(guild, self.channel_id)
@@ -296,8 +297,7 @@ class EndGameView(nextcord.ui.View):
         from cogs.events import get_server_state, release_game_channel
 
         server_state = get_server_state(self.guild_id)
-        if self.channel_id in server_state.instances:
-            del server_state.instances[self.channel_id]
+        server_state.remove_instance(self.channel_id)
         guild = self.bot.get_guild(self.guild_id)
         if guild:
             await release_game_channel(guild, self.channel_id)
@@ -499,6 +499,7 @@ def generate_challenge(game_type: GameType) -> Challenge:
         )
 
     elif game_type == GameType.TRIVIA:
+        # blocking HTTP - rounds are started via asyncio.to_thread for this reason
         question, answers = get_trivia_question()
         return Challenge(
             challenge_type=game_type,
@@ -586,124 +587,140 @@ async def auto_evaluate_round(guild_id: int, channel_id: int, bot=None):
     if not channel:
         return
 
-    results = instance.evaluate_current_challenge()
+    # the timer and the last answer can both land here - only evaluate once
+    if instance.evaluating:
+        return
 
-    new_leader = instance.check_leader_change()
-    if new_leader:
-        leader_embed = nextcord.Embed(
-            title="🚨 NEW LEADER! 🚨",
-            description=f"<@{new_leader}> has taken the lead!",
-            color=nextcord.Color.gold(),
-        )
+    instance.evaluating = True
+    try:
+        # verification may call out to the AI provider - keep it off the event loop
+        results = await asyncio.to_thread(instance.evaluate_current_challenge)
+
+        new_leader = instance.check_leader_change()
+        if new_leader:
+            leader_embed = nextcord.Embed(
+                title="🚨 NEW LEADER! 🚨",
+                description=f"<@{new_leader}> has taken the lead!",
+                color=nextcord.Color.gold(),
+            )
 
-        await channel.send(f"<@{new_leader}>", embed=leader_embed)
+            await channel.send(f"<@{new_leader}>", embed=leader_embed)
 
-    embed = nextcord.Embed(title="Round Results", color=nextcord.Color.blue())
+        embed = nextcord.Embed(title="Round Results", color=nextcord.Color.blue())
 
-    if instance.current_challenge and instance.current_challenge.correct_answer:
-        correct_answer = instance.current_challenge.correct_answer
-        if isinstance(correct_answer, list):
-            answer_text = " / ".join(str(ans) for ans in correct_answer)
-        else:
-            answer_text = str(correct_answer)
-        embed.add_field(name="Correct Answer", value=f"`{answer_text}`", inline=False)
-
-    if results["correct_players"]:
-        correct_names = [f"<@{uid}>" for uid in results["correct_players"]]
-        embed.add_field(
-            name="Correct",
-            value=", ".join(correct_names) if correct_names else "None",
-            inline=False,
-        )
+        if instance.current_challenge and instance.current_challenge.correct_answer:
+            correct_answer = instance.current_challenge.correct_answer
+            if isinstance(correct_answer, list):
+                answer_text = " / ".join(str(ans) for ans in correct_answer)
+            else:
+                answer_text = str(correct_answer)
+            embed.add_field(
+                name="Correct Answer", value=f"`{answer_text}`", inline=False
+            )
 
-    if results["failed_players"]:
-        failed_names = [f"<@{uid}>" for uid in results["failed_players"]]
-        embed.add_field(
-            name="Incorrect/No Answer",
-            value=", ".join(failed_names) if failed_names else "None",
-            inline=False,
-        )
+        if results["correct_players"]:
+            correct_names = [f"<@{uid}>" for uid in results["correct_players"]]
+            embed.add_field(
+                name="Correct",
+                value=", ".join(correct_names) if correct_names else "None",
+                inline=False,
+            )
 
-    leaderboard = []
-    for user_id, player in sorted(
-        instance.players.items(), key=lambda x: x[1].score, reverse=True
-    ):
-        if player.state == PlayerState.ACTIVE:
-            leaderboard.append(f"<@{user_id}>: **{player.score}** pts")
-
-    if leaderboard:
-        embed.add_field(
-            name="Leaderboard",
-            value="\n".join(leaderboard[:5]),
-            inline=False,
-        )
+        if results["failed_players"]:
+            failed_names = [f"<@{uid}>" for uid in results["failed_players"]]
+            embed.add_field(
+                name="Incorrect/No Answer",
+                value=", ".join(failed_names) if failed_names else "None",
+                inline=False,
+            )
 
-    await channel.send(embed=embed)
+        leaderboard = []
+        for user_id, player in sorted(
+            instance.players.items(), key=lambda x: x[1].score, reverse=True
+        ):
+            if player.state == PlayerState.ACTIVE:
+                leaderboard.append(f"<@{user_id}>: **{player.score}** pts")
 
-    if instance.all_players_answered():
-        early_end_embed = nextcord.Embed(
-            title="Round Ended Early!",
-            description="All players have answered!",
-            color=nextcord.Color.green(),
+        if leaderboard:
+            embed.add_field(
+                name="Leaderboard",
+                value="\n".join(leaderboard[:5]),
+                inline=False,
+            )
+
+        await channel.send(embed=embed)
+
+        if instance.all_players_answered():
+            early_end_embed = nextcord.Embed(
+                title="Round Ended Early!",
+                description="All players have answered!",
+                color=nextcord.Color.green(),
+            )
+            await channel.send(embed=early_end_embed)
+
+        active_players = sum(
+            1 for p in instance.players.values() if p.state == PlayerState.ACTIVE
         )
-        await channel.send(embed=early_end_embed)
 
-    active_players = sum(
-        1 for p in instance.players.values() if p.state == PlayerState.ACTIVE
-    )
+        if active_players <= 1 or instance.current_round >= instance.config.main_rounds:
+            await send_host_message(channel_id, "final_results", bot)
+            final_results = instance.end_game()
 
-    if active_players <= 1 or instance.current_round >= instance.config.main_rounds:
-        await send_host_message(channel_id, "final_results", bot)
-        final_results = instance.end_game()
+            embed = nextcord.Embed(title="THE END", color=nextcord.Color.green())
 
-        embed = nextcord.Embed(title="THE END", color=nextcord.Color.green())
+            if final_results["winners"]:
+                winner_names = [f"<@{uid}>" for uid in final_results["winners"]]
+                embed.add_field(
+                    name="Winners", value=", ".join(winner_names), inline=False
+                )
 
-        if final_results["winners"]:
-            winner_names = [f"<@{uid}>" for uid in final_results["winners"]]
-            embed.add_field(name="Winners", value=", ".join(winner_names), inline=False)
+            embed.add_field(
+                name="Final Scores",
+                value="\n".join(
+                    [
+                        f"<@{uid}>: {score}"
+                        for uid, score in final_results["scores"].items()
+                    ]
+                ),
+                inline=False,
+            )
 
-        embed.add_field(
-            name="Final Scores",
-            value="\n".join(
-                [f"<@{uid}>: {score}" for uid, score in final_results["scores"].items()]
-            ),
-            inline=False,
-        )
+            await channel.send(embed=embed)
+            await send_host_message(channel_id, "outro", bot)
 
-        await channel.send(embed=embed)
-        await send_host_message(channel_id, "outro", bot)
+            view = EndGameView(guild_id, channel_id, bot)
+            await channel.send(
+                "Click **End** to close this game. It will close automatically in 30 seconds.",
+                view=view,
+            )
+        else:
 
-        view = EndGameView(guild_id, channel_id, bot)
-        await channel.send(
-            "Click **End** to close this game. It will close automatically in 30 seconds.",
-            view=view,
-        )
-    else:
+            async def start_next():
+                await asyncio.sleep(3)
+                if channel_id in server_state.instances:
+                    await send_host_message(channel_id, "main_round", bot)
+                    challenge = await asyncio.to_thread(instance.start_main_round)
 
-        async def start_next():
-            await asyncio.sleep(3)
-            if channel_id in server_state.instances:
-                await send_host_message(channel_id, "main_round", bot)
-                challenge = instance.start_main_round()
-
-                if challenge.challenge_type == GameType.MEMORY_GAME:
-                    await display_memory_sequence(channel, challenge)
-                    sequence_length = len(challenge.metadata["sequence"])
-                    display_time = sequence_length * 1.5 + 2
-                    schedule_round_evaluation(
-                        guild_id,
-                        channel_id,
-                        challenge.time_limit + int(display_time),
-                        bot,
-                    )
-                else:
-                    embed = create_round_embed(instance, challenge)
-                    await channel.send(embed=embed)
-                    schedule_round_evaluation(
-                        guild_id, channel_id, challenge.time_limit, bot
-                    )
+                    if challenge.challenge_type == GameType.MEMORY_GAME:
+                        await display_memory_sequence(channel, challenge)
+                        sequence_length = len(challenge.metadata["sequence"])
+                        display_time = sequence_length * 1.5 + 2
+                        schedule_round_evaluation(
+                            guild_id,
+                            channel_id,
+                            challenge.time_limit + int(display_time),
+                            bot,
+                        )
+                    else:
+                        embed = create_round_embed(instance, challenge)
+                        await channel.send(embed=embed)
+                        schedule_round_evaluation(
+                            guild_id, channel_id, challenge.time_limit, bot
+                        )
 
-        asyncio.create_task(start_next())
+            asyncio.create_task(start_next())
+    finally:
+        instance.evaluating = False
 
 
 def schedule_round_evaluation(guild_id: int, channel_id: int, delay: int, bot=None):
@@ -813,7 +830,7 @@ class GameCog(commands.Cog):
             return
 
         for channel_id, instance in server_state.instances.items():
-            if str(user_id) in instance.players:
+            if user_id in instance.players:
                 await interaction.response.send_message(
                     f"You are already in a game! Please finish your current game first.\n"
                     f"Game: {instance.name} in <#{channel_id}>",
@@ -880,20 +897,12 @@ class GameCog(commands.Cog):
                     name="Waiting Players", value=", ".join(waiting_names), inline=False
                 )
 
-            active_games = len(
-                [
-                    i
-                    for i in server_state.instances.values()
-                    if i.state == GameState.IN_PROGRESS
-                ]
-            )
-            waiting_games = len(
-                [
-                    i
-                    for i in server_state.instances.values()
-                    if i.state == GameState.WAITING
-                ]
+            # one pass over the instances for both counts
+            state_counts = collections.Counter(
+                i.state for i in server_state.instances.values()
             )
+            active_games = state_counts[GameState.IN_PROGRESS]
+            waiting_games = state_counts[GameState.WAITING]
             embed.add_field(name="Active Games", value=str(active_games), inline=True)
             embed.add_field(
                 name="Games Waiting to Start", value=str(waiting_games), inline=True
@@ -983,10 +992,7 @@ class GameCog(commands.Cog):
 
         # check if user is already in instance
         for other_channel_id, other_instance in server_state.instances.items():
-            if (
-                other_channel_id != channel_id
-                and str(user_id) in other_instance.players
-            ):
+            if other_channel_id != channel_id and user_id in other_instance.players:
                 await interaction.followup.send(
                     f"You are already in another game: {other_instance.name} in <#{other_channel_id}>\n"
                     f"Please finish that game first before starting a new one.",
@@ -994,8 +1000,8 @@ class GameCog(commands.Cog):
                 )
                 return
 
-        if str(user_id) not in instance.players:
-            instance.add_player(str(user_id))
+        if user_id not in instance.players:
+            instance.add_player(user_id)
 
             try:
                 from cogs.events import assign_player_to_game_role
@@ -1047,7 +1053,7 @@ class GameCog(commands.Cog):
             await asyncio.sleep(5)
             if channel_id in server_state.instances:
                 await send_host_message(channel_id, "main_round", self.bot)
-                challenge = instance.start_main_round()
+                challenge = await asyncio.to_thread(instance.start_main_round)
 
                 channel = guild.get_channel(channel_id)
                 if channel:
@@ -1098,7 +1104,7 @@ class GameCog(commands.Cog):
             return
 
         await send_host_message(channel_id, "main_round", self.bot)
-        challenge = instance.start_main_round()
+        challenge = await asyncio.to_thread(instance.start_main_round)
 
         if challenge.challenge_type == GameType.MEMORY_GAME:
             await display_memory_sequence(interaction.channel, challenge)
@@ -5,7 +5,11 @@ from nextcord import Interaction
 # from typing import Optional
 
 from config import SERVER_CONFIG_OPTIONS, ERROR_RESPONSE
-from cogs.events import get_server_state
+from cogs.events import (
+    AVAILABLE_CHANNEL_TOPIC,
+    ensure_voyager_category,
+    get_server_state,
+)
 
 logger = logging.getLogger("voyager_discord")
 
@@ -38,8 +42,6 @@ class ServerCog(commands.Cog):
             )
             return
 
-        from cogs.events import ensure_voyager_category
-
         server_state = get_server_state(guild.id)
         max_channels = server_state.config.get("max_channels", 10)
 
@@ -66,19 +68,18 @@ class ServerCog(commands.Cog):
             channel = await guild.create_text_channel(
                 channel_name,
                 category=category,
-                topic="Available game channel - waiting for assignment",
+                topic=AVAILABLE_CHANNEL_TOPIC,
                 reason=f"Server admin-created game channel: {name}",
                 overwrites=overwrites,
             )
 
-            server_state.all_game_channels.append(channel.id)
-            server_state.available_game_channels.append(channel.id)
+            total = server_state.register_new_channel(channel.id)
 
             await interaction.response.send_message(
                 f"Game channel created: {name}\n"
                 f"Channel: <#{channel.id}>\n"
                 f"Status: Available for games\n"
-                f"Channels Total: {len(server_state.all_game_channels)}/{max_channels}"
+                f"Channels Total: {total}/{max_channels}"
             )
 
         except Exception as e:
@@ -25,7 +25,11 @@ def set_bot(bot):
 @tasks.loop(seconds=5.0)  # TODO: increase this if public
 async def process_waitlist():
     """Process waitlists for all servers"""
-    from cogs.events import SERVERS, allocate_game_channel
+    from cogs.events import (
+        SERVERS,
+        allocate_game_channel,
+        assign_players_to_game_role,
+    )
     from cogs.game import create_instance_with_dialogue, GameControlView
 
     if _bot is None:
@@ -64,50 +68,20 @@ async def process_waitlist():
                 )
                 continue
 
-            for player_id in players:
-                try:
-                    from cogs.events import assign_player_to_game_role
-
-                    logger.debug(
-                        f"Processing player_id: {player_id} (type: {type(player_id)})"
-                    )
-
-                    # get_member fetches from cache first
-                    user = guild.get_member(player_id)
-                    if not user:
-                        logger.debug(
-                            f"User {player_id} not found in guild cache, trying Discord API..."
-                        )
-                        try:
-                            # fetch forcefuolly retrieves from API - we try to avoid this
-                            user = await guild.fetch_member(player_id)
-                            logger.debug(
-                                f"Successfully fetched user {player_id} from Discord API"
-                            )
-                        except Exception as fetch_error:
-                            logger.error(
-                                f"Failed to fetch user {player_id} from Discord API: {fetch_error}"
-                            )
-                            logger.warning(
-                                f"Available members: {[m.id for m in guild.members[:5]]}..."
-                            )
-                            continue
-
-                    success = await assign_player_to_game_role(
-                        guild, player_id, game_channel.id, game_name
-                    )
-                    if not success:
-                        logger.error(f"Failed to assign role to user {player_id}")
-                except Exception as e:
-                    logger.error(f"Failed to assign role to user {player_id}: {e}")
+            results = await assign_players_to_game_role(
+                guild, players, game_channel.id, game_name
+            )
+            for player_id, success in zip(players, results):
+                if not success:
+                    logger.error(f"Failed to assign role to user {player_id}")
 
             instance = create_instance_with_dialogue(
                 guild_id, game_channel.id, game_name
             )
             for player_id in players:
-                instance.add_player(str(player_id))
+                instance.add_player(player_id)
 
-            server_state.instances[game_channel.id] = instance
+            server_state.add_instance(game_channel.id, instance)
 
             # update ephemeral messages for allocated players
             for player_id in players:
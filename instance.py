@@ -2,12 +2,16 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import List, Dict, Any, Optional, Union, Callable
 
-from ai import verify
+from ai import matches_exactly, verify_many
 from config import SCORING, DEFAULT_LIVES, DEFAULT_TIME_LIMIT
 
 # import typing as t
 import time
 import random
+import threading
+
+# slack user ids are strings ("U123..."), discord snowflakes stay ints
+UserId = Union[str, int]
 
 
 # region Enums
@@ -81,7 +85,7 @@ def get_random_game_type(exclude: List[GameType] = None) -> GameType:
 
 @dataclass
 class Player:
-    user_id: str
+    user_id: UserId
     state: PlayerState = PlayerState.ACTIVE
     score: int = 0
     lives: int = DEFAULT_LIVES
@@ -124,7 +128,7 @@ class Instance:
     def __init__(self, channel_id: str, name: str, config: Optional[GameConfig] = None):
         self.channel_id = channel_id
         self.name = name
-        self.players: Dict[str, Player] = {}
+        self.players: Dict[UserId, Player] = {}
         self.state = GameState.WAITING
         self.current_phase = GamePhase.INTRO
         self.start_time: Optional[float] = None
@@ -135,10 +139,18 @@ class Instance:
         self.current_challenge: Optional[Challenge] = None
         self.round_start_time: Optional[float] = None
         self.recent_game_types: List[GameType] = []
-        self.previous_leader: Optional[str] = None
+        self.previous_leader: Optional[UserId] = None
+        # set by the frontend while a round is being scored
+        self.evaluating = False
 
         # callback here is important for eventual custom challenges
         self.challenge_generator: Optional[Callable[[GameType], Challenge]] = None
+        # called with (old_state, new_state) whenever the game state changes
+        self.state_listener: Optional[Callable[[GameState, GameState], None]] = None
+        # called with (user_id, joined) whenever a player joins or leaves
+        self.player_listener: Optional[Callable[[UserId, bool], None]] = None
+        # frontends call in from several threads - only held for state transitions
+        self._transition_lock = threading.Lock()
 
     def set_challenge_generator(
         self, generator: Callable[[GameType], Challenge]
@@ -146,25 +158,50 @@ class Instance:
         """Set the challenge generator callback"""
         self.challenge_generator = generator
 
-    def add_player(self, user_id: str) -> None:
+    def set_state_listener(
+        self, listener: Callable[[GameState, GameState], None]
+    ) -> None:
+        """Set the state change callback"""
+        self.state_listener = listener
+
+    def set_player_listener(
+        self, listener: Optional[Callable[[UserId, bool], None]]
+    ) -> None:
+        """Set the player join/leave callback"""
+        self.player_listener = listener
+
+    def _set_state(self, new_state: GameState) -> None:
+        old_state = self.state
+        self.state = new_state
+        if self.state_listener and old_state != new_state:
+            self.state_listener(old_state, new_state)
+
+    def add_player(self, user_id: UserId) -> None:
         if user_id not in self.players:
             self.players[user_id] = Player(user_id=user_id)
+            if self.player_listener:
+                self.player_listener(user_id, True)
 
-    def remove_player(self, user_id: str) -> None:
+    def remove_player(self, user_id: UserId) -> None:
         if user_id in self.players:
             del self.players[user_id]
+            if self.player_listener:
+                self.player_listener(user_id, False)
 
     def start_game(self, config: Optional[GameConfig] = None) -> Dict[str, Any]:
-        if len(self.players) < 1:
-            raise ValueError("Not enough players to start")
+        with self._transition_lock:
+            if self.state != GameState.WAITING:
+                raise ValueError("The game has already started")
+            if len(self.players) < 1:
+                raise ValueError("Not enough players to start")
 
-        self.state = GameState.IN_PROGRESS
-        self.start_time = time.time()
+            if config:
+                self.config = config
+            elif not self.config:
+                self.config = GameConfig(len(self.players))
 
-        if config:
-            self.config = config
-        elif not self.config:
-            self.config = GameConfig(len(self.players))
+            self.start_time = time.time()
+            self._set_state(GameState.IN_PROGRESS)
 
         return self.get_game_state()
 
@@ -188,14 +225,19 @@ class Instance:
         }
 
     def end_game(self, success: bool = True) -> Dict[str, Any]:
-        self.state = GameState.COMPLETED if success else GameState.FAILED
-        self.end_time = time.time()
+        with self._transition_lock:
+            if self.state in (GameState.COMPLETED, GameState.FAILED):
+                # already ended by another thread - don't re-pick winners
+                return self.get_final_results()
 
-        if success:
-            max_score = max((p.score for p in self.players.values()), default=0)
-            for player in self.players.values():
-                if player.score == max_score:
-                    player.state = PlayerState.WINNER
+            self._set_state(GameState.COMPLETED if success else GameState.FAILED)
+            self.end_time = time.time()
+
+            if success:
+                max_score = max((p.score for p in self.players.values()), default=0)
+                for player in self.players.values():
+                    if player.score == max_score:
+                        player.state = PlayerState.WINNER
 
         return self.get_final_results()
 
@@ -245,7 +287,7 @@ class Instance:
         return self.current_challenge
 
     def submit_answer(
-        self, user_id: str, answer: str, message_ts: Optional[str] = None
+        self, user_id: UserId, answer: str, message_ts: Optional[str] = None
     ) -> Optional[str]:
         """Submit answer for the current challenge"""
         if user_id in self.players:
@@ -333,19 +375,43 @@ class Instance:
             if isinstance(correct_answers, str):
                 correct_answers = [correct_answers]
 
+            answered = [
+                user_id
+                for user_id in players_to_evaluate
+                if self.players[user_id].current_answer and correct_answers
+            ]
+
+            # exact matches against any accepted answer need no AI call at all
+            correct_ids = {
+                user_id
+                for user_id in answered
+                if matches_exactly(
+                    self.players[user_id].current_answer, correct_answers
+                )
+            }
+
+            # then the primary answer for everyone else in one concurrent batch,
+            # and the alternates only for players that still haven't matched
+            for candidates in (correct_answers[:1], correct_answers[1:]):
+                pairs = []
+                owners = []
+                for user_id in answered:
+                    if user_id in correct_ids:
+                        continue
+                    given_answer = self.players[user_id].current_answer
+                    for correct_answer in candidates:
+                        pairs.append((given_answer, correct_answer))
+                        owners.append(user_id)
+
+                correct_ids.update(
+                    user_id
+                    for user_id, is_correct in zip(owners, verify_many(pairs))
+                    if is_correct
+                )
+
             for user_id in players_to_evaluate:
-                player = self.players[user_id]
-                if player.current_answer and correct_answers:
-                    is_correct = False
-                    for correct_answer in correct_answers:
-                        if verify(player.current_answer, correct_answer):
-                            is_correct = True
-                            break
-
-                    if is_correct:
-                        results["correct_players"].append(user_id)
-                    else:
-                        results["failed_players"].append(user_id)
+                if user_id in correct_ids:
+                    results["correct_players"].append(user_id)
                 else:
                     results["failed_players"].append(user_id)
 
@@ -376,7 +442,7 @@ class Instance:
             if response_time <= 5.0:
                 player.score += SCORING["speed_bonus_points"]
 
-    def check_leader_change(self) -> Optional[str]:
+    def check_leader_change(self) -> Optional[UserId]:
         """Check if there's a new leader and return their user_id"""
         if not self.players:
             return None
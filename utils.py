@@ -4,6 +4,9 @@ import random
 import requests
 import logging
 import html
+import threading
+import time
+from concurrent.futures import Executor, as_completed
 from config import TRIVIA_CATEGORIES, RIDDLES_CSV_PATH
 
 
@@ -75,7 +78,12 @@ def is_word_valid(word: str, lang: str = "en") -> bool:
 
 
 def purge_channel_messages(
-    app, channel_id: str, user_filter: str = None
+    app,
+    channel_id: str,
+    user_filter: str = None,
+    executor: Executor = None,
+    limiter: "RateLimiter" = None,
+    call: t.Callable = None,
 ) -> t.Dict[str, t.Any]:
     """
     Purge all messages from a channel, optionally filtered by user.
@@ -84,19 +92,30 @@ def purge_channel_messages(
         app: Slack app instance
         channel_id: ID of the channel to purge
         user_filter: Optional user ID to filter messages (only delete messages from this user)
+        executor: Optional executor to issue each page's deletes concurrently
+        limiter: Optional RateLimiter each delete waits on before calling Slack
+        call: Optional wrapper every API call goes through, as call(fn, **kwargs)
 
     Returns:
         Dict with success status and message count
     """
     logger = logging.getLogger("voyager")
+    if call is None:
+
+        def call(fn, **kwargs):
+            return fn(**kwargs)
+
     deleted_count = 0
     errors = []
 
     try:
         cursor = None
         while True:
-            result = app.client.conversations_history(
-                channel=channel_id, limit=100, cursor=cursor
+            result = call(
+                app.client.conversations_history,
+                channel=channel_id,
+                limit=100,
+                cursor=cursor,
             )
 
             messages = result.get("messages", [])
@@ -106,11 +125,27 @@ def purge_channel_messages(
             if user_filter:
                 messages = [msg for msg in messages if msg.get("user") == user_filter]
 
-            for message in messages:
-                try:
-                    app.client.chat_delete(channel=channel_id, ts=message["ts"])
+            def delete(message):
+                if limiter:
+                    limiter.acquire()
+                call(app.client.chat_delete, channel=channel_id, ts=message["ts"])
+
+            if executor:
+                futures = {executor.submit(delete, msg): msg for msg in messages}
+                outcomes = [(futures[f], f.exception()) for f in as_completed(futures)]
+            else:
+                outcomes = []
+                for message in messages:
+                    try:
+                        delete(message)
+                        outcomes.append((message, None))
+                    except Exception as e:
+                        outcomes.append((message, e))
+
+            for message, e in outcomes:
+                if e is None:
                     deleted_count += 1
-                except Exception as e:
+                else:
                     error_msg = f"Failed to delete message {message['ts']}: {str(e)}"
                     logger.error(error_msg)
                     errors.append(error_msg)
@@ -129,3 +164,35 @@ def purge_channel_messages(
         "deleted_count": deleted_count,
         "errors": errors,
     }
+
+
+class RateLimiter:
+    """Token bucket shared between threads - acquire() blocks until a call is allowed"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate  # tokens per second
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass